@@ -146,9 +146,14 @@ fn runSingleTest(allocator: Allocator, test_file: []const u8) !void {
 
     print("Running {s} with pocketpy-ucharm...\n\n", .{test_file});
 
-    const argv = [_][]const u8{ pocketpy_path, test_file };
+    // Run from the test's directory, as compat_runner.py does: pocketpy-ucharm
+    // resolves imports such as the shared _harness module relative to cwd
+    const test_dir = std.fs.path.dirname(test_file);
+    const script = if (test_dir != null) std.fs.path.basename(test_file) else test_file;
+    const argv = [_][]const u8{ pocketpy_path, script };
 
     var child = std.process.Child.init(&argv, allocator);
+    child.cwd = test_dir;
     child.stdout_behavior = .Inherit;
     child.stderr_behavior = .Inherit;
 
@@ -0,0 +1,126 @@
+"""
+Shared test harness for the simplified ucharm compatibility tests.
+Works on both CPython and pocketpy-ucharm.
+
+Usage:
+    from _harness import test, skip, skip_many, note, section, summary
+    ...
+    sys.exit(summary())
+
+Result lines are buffered and written once per section; set QUIET=1 in
+the environment to leave out the PASS lines. Everything goes through
+sys.stdout.write: on PocketPy it is not ordered with print(), so tests
+using this harness should not print() themselves.
+
+pocketpy-ucharm resolves imports relative to the working directory, not
+the script's, so tests are run from tests/cpython (compat_runner.py and
+`ucharm test <file>` both do this). Each test exits 1 if it cannot import
+this module.
+
+Capability snapshots and known-value tables in these tests are plain sets
+rather than frozensets: PocketPy has no frozenset.
+"""
+
+import os
+import sys
+
+_w = sys.stdout.write
+
+# QUIET=1 drops the PASS lines; FAIL/SKIP lines and the totals still print
+_QUIET = "QUIET" in os.environ
+
+# Rule written above the totals
+_SEP = "\n" + "=" * 50 + "\n"
+
+
+class Counters:
+    __slots__ = ("passed", "failed", "skipped", "errors", "lines")
+
+    def __init__(self):
+        self.passed = 0
+        self.failed = 0
+        self.skipped = 0
+        self.errors = []
+        self.lines = []
+
+
+C = Counters()
+
+
+def test(name, condition):
+    # A zero-argument callable is evaluated here, so an exception it raises
+    # fails this test instead of ending the run; the exception type and text
+    # are written under the FAIL line so a bug in the check itself shows.
+    # Callers still gate on the capability first and skip() when it is missing.
+    error = None
+    if callable(condition):
+        try:
+            condition = condition()
+        except Exception as e:
+            condition = False
+            error = "    ERROR: " + type(e).__name__ + ": " + str(e)
+    if condition:
+        C.passed += 1
+        if not _QUIET:
+            C.lines.append("  PASS: " + name)
+    else:
+        C.failed += 1
+        C.errors.append(name)
+        C.lines.append("  FAIL: " + name)
+        if error is not None:
+            C.lines.append(error)
+
+
+def skip(name, reason):
+    C.skipped += 1
+    C.lines.append("  SKIP: " + name + " (" + reason + ")")
+
+
+def skip_many(names, reason):
+    """Skip several tests that share one reason."""
+    tail = " (" + reason + ")"
+    C.skipped += len(names)
+    for name in names:
+        C.lines.append("  SKIP: " + name + tail)
+
+
+def note(text):
+    """Buffer a free-form line, such as an error detail, with the results."""
+    C.lines.append(text)
+
+
+def flush():
+    """Write the buffered result lines in one call."""
+    if C.lines:
+        _w("\n".join(C.lines) + "\n")
+        C.lines.clear()
+
+
+def section(title):
+    """Flush the previous section and start a new one."""
+    flush()
+    _w("\n=== " + title + " ===\n")
+
+
+def reset():
+    """Clear the counters and any buffered lines."""
+    C.__init__()
+
+
+def summary():
+    """Print the totals and return the exit status: 1 if any test failed.
+
+    The counters are reset afterwards, so a main() run again in the same
+    process reports only its own results.
+    """
+    flush()
+    out = _SEP + f"Results: {C.passed} passed, {C.failed} failed, {C.skipped} skipped\n"
+    errs = C.errors
+    if errs:
+        _w(out + "Failed tests:\n  - " + "\n  - ".join(errs) + "\n")
+        status = 1
+    else:
+        _w(out + "All tests passed!\n")
+        status = 0
+    reset()
+    return status
@@ -8,6 +8,8 @@ Based on CPython's Lib/test/test_math.py
 import math
 import sys
 
+_w = sys.stdout.write
+
 # Test tracking
 _passed = 0
 _failed = 0
@@ -19,31 +21,39 @@ def test(name, condition):
     global _passed, _failed, _errors
     if condition:
         _passed += 1
-        print(f"  PASS: {name}")
+        _w("  PASS: " + name + "\n")
     else:
         _failed += 1
         _errors.append(name)
-        print(f"  FAIL: {name}")
+        _w("  FAIL: " + name + "\n")
 
 
 def skip(name, reason):
     global _skipped
     _skipped += 1
-    print(f"  SKIP: {name} ({reason})")
+    _w("  SKIP: " + name + " (" + reason + ")\n")
 
 
 def approx_equal(a, b, tol=1e-9):
     """Check if two floats are approximately equal."""
+    # == first so equal infinities pass; the chained compare skips abs()
     if a == b:
         return True
-    return abs(a - b) < tol
+    d = a - b
+    return -tol < d < tol
+
+
+# Frequently used constants, bound once instead of re-reading math.pi
+_pi = math.pi
+_half_pi = _pi / 2
+_quarter_pi = _pi / 4
 
 
 # ============================================================================
 # Constants
 # ============================================================================
 
-print("\n=== Constants ===")
+_w("\n=== Constants ===\n")
 
 test("pi exists", hasattr(math, "pi"))
 test("pi value", approx_equal(math.pi, 3.141592653589793, 1e-10))
@@ -66,7 +76,7 @@ test("nan exists", math.nan != math.nan)  # NaN is not equal to itself
 # Basic functions
 # ============================================================================
 
-print("\n=== Basic functions ===")
+_w("\n=== Basic functions ===\n")
 
 # abs/fabs
 test("fabs positive", math.fabs(3.14) == 3.14)
@@ -92,7 +102,7 @@ test("trunc negative", math.trunc(-3.8) == -3)
 # Power and logarithmic functions
 # ============================================================================
 
-print("\n=== Power and logarithmic functions ===")
+_w("\n=== Power and logarithmic functions ===\n")
 
 # sqrt
 test("sqrt 4", math.sqrt(4) == 2.0)
@@ -133,45 +143,45 @@ test("log2 1", math.log2(1) == 0.0)
 # Trigonometric functions
 # ============================================================================
 
-print("\n=== Trigonometric functions ===")
+_w("\n=== Trigonometric functions ===\n")
 
 # sin
 test("sin 0", math.sin(0) == 0.0)
-test("sin pi/2", approx_equal(math.sin(math.pi / 2), 1.0))
-test("sin pi", approx_equal(math.sin(math.pi), 0.0, 1e-15))
+test("sin pi/2", approx_equal(math.sin(_half_pi), 1.0))
+test("sin pi", approx_equal(math.sin(_pi), 0.0, 1e-15))
 
 # cos
 test("cos 0", math.cos(0) == 1.0)
-test("cos pi/2", approx_equal(math.cos(math.pi / 2), 0.0, 1e-15))
-test("cos pi", approx_equal(math.cos(math.pi), -1.0))
+test("cos pi/2", approx_equal(math.cos(_half_pi), 0.0, 1e-15))
+test("cos pi", approx_equal(math.cos(_pi), -1.0))
 
 # tan
 test("tan 0", math.tan(0) == 0.0)
-test("tan pi/4", approx_equal(math.tan(math.pi / 4), 1.0))
+test("tan pi/4", approx_equal(math.tan(_quarter_pi), 1.0))
 
 # asin
 test("asin 0", math.asin(0) == 0.0)
-test("asin 1", approx_equal(math.asin(1), math.pi / 2))
+test("asin 1", approx_equal(math.asin(1), _half_pi))
 
 # acos
 test("acos 1", math.acos(1) == 0.0)
-test("acos 0", approx_equal(math.acos(0), math.pi / 2))
+test("acos 0", approx_equal(math.acos(0), _half_pi))
 
 # atan
 test("atan 0", math.atan(0) == 0.0)
-test("atan 1", approx_equal(math.atan(1), math.pi / 4))
+test("atan 1", approx_equal(math.atan(1), _quarter_pi))
 
 # atan2
 test("atan2 0,1", math.atan2(0, 1) == 0.0)
-test("atan2 1,0", approx_equal(math.atan2(1, 0), math.pi / 2))
-test("atan2 1,1", approx_equal(math.atan2(1, 1), math.pi / 4))
+test("atan2 1,0", approx_equal(math.atan2(1, 0), _half_pi))
+test("atan2 1,1", approx_equal(math.atan2(1, 1), _quarter_pi))
 
 
 # ============================================================================
 # Hyperbolic functions
 # ============================================================================
 
-print("\n=== Hyperbolic functions ===")
+_w("\n=== Hyperbolic functions ===\n")
 
 # sinh/cosh/tanh may not be available in all implementations
 if hasattr(math, "sinh"):
@@ -200,20 +210,20 @@ else:
 # Angular conversion
 # ============================================================================
 
-print("\n=== Angular conversion ===")
+_w("\n=== Angular conversion ===\n")
 
-test("degrees pi", approx_equal(math.degrees(math.pi), 180.0))
-test("degrees pi/2", approx_equal(math.degrees(math.pi / 2), 90.0))
+test("degrees pi", approx_equal(math.degrees(_pi), 180.0))
+test("degrees pi/2", approx_equal(math.degrees(_half_pi), 90.0))
 
-test("radians 180", approx_equal(math.radians(180), math.pi))
-test("radians 90", approx_equal(math.radians(90), math.pi / 2))
+test("radians 180", approx_equal(math.radians(180), _pi))
+test("radians 90", approx_equal(math.radians(90), _half_pi))
 
 
 # ============================================================================
 # Special functions
 # ============================================================================
 
-print("\n=== Special functions ===")
+_w("\n=== Special functions ===\n")
 
 # copysign
 test("copysign positive", math.copysign(1.0, 2.0) == 1.0)
@@ -258,46 +268,38 @@ test("isnan nan", math.isnan(float("nan")))
 # Edge cases
 # ============================================================================
 
-print("\n=== Edge cases ===")
-
-# sqrt of negative - CPython raises ValueError, PocketPy returns nan
-try:
-    result = math.sqrt(-1)
-    # PocketPy returns nan instead of raising
-    test("sqrt negative handling", math.isnan(result))
-except ValueError:
-    # CPython raises ValueError
-    test("sqrt negative handling", True)
-
-# log of zero - CPython raises ValueError, PocketPy returns -inf
-try:
-    result = math.log(0)
-    # PocketPy returns -inf instead of raising
-    test("log 0 handling", math.isinf(result) and result < 0)
-except ValueError:
-    # CPython raises ValueError
-    test("log 0 handling", True)
-
-# log of negative - CPython raises ValueError, PocketPy returns nan
-try:
-    result = math.log(-1)
-    # PocketPy returns nan instead of raising
-    test("log negative handling", math.isnan(result))
-except ValueError:
-    # CPython raises ValueError
-    test("log negative handling", True)
+_w("\n=== Edge cases ===\n")
+
+
+# CPython raises ValueError on domain errors, PocketPy returns nan/-inf.
+# Each function is called and probed on its own: a ValueError counts as
+# correct handling, otherwise the returned value is checked.
+def domain_result(fn, arg):
+    """Return fn(arg), or None if it raises ValueError."""
+    try:
+        return fn(arg)
+    except ValueError:
+        return None
+
+
+result = domain_result(math.sqrt, -1)
+test("sqrt negative handling", result is None or math.isnan(result))
+result = domain_result(math.log, 0)
+test("log 0 handling", result is None or (math.isinf(result) and result < 0))
+result = domain_result(math.log, -1)
+test("log negative handling", result is None or math.isnan(result))
 
 
 # ============================================================================
 # Summary
 # ============================================================================
 
-print("\n" + "=" * 50)
-print(f"Results: {_passed} passed, {_failed} failed, {_skipped} skipped")
+_w("\n" + "=" * 50 + "\n")
+_w(f"Results: {_passed} passed, {_failed} failed, {_skipped} skipped\n")
 if _errors:
-    print("Failed tests:")
+    _w("Failed tests:\n")
     for e in _errors:
-        print(f"  - {e}")
+        _w(f"  - {e}\n")
     sys.exit(1)
 else:
-    print("All tests passed!")
+    _w("All tests passed!\n")
@@ -7,6 +7,8 @@ Based on CPython's Lib/test/test_operator.py
 
 import sys
 
+_w = sys.stdout.write
+
 # Test tracking
 _passed = 0
 _failed = 0
@@ -18,219 +20,260 @@ def test(name, condition):
     global _passed, _failed, _errors
     if condition:
         _passed += 1
-        print(f"  PASS: {name}")
+        _w("  PASS: " + name + "\n")
     else:
         _failed += 1
         _errors.append(name)
-        print(f"  FAIL: {name}")
+        _w("  FAIL: " + name + "\n")
 
 
 def skip(name, reason):
     global _skipped
     _skipped += 1
-    print(f"  SKIP: {name} ({reason})")
+    _w("  SKIP: " + name + " (" + reason + ")\n")
 
 
 try:
     import operator
 except ImportError:
-    print("SKIP: operator module not available")
+    _w("SKIP: operator module not available\n")
     sys.exit(0)
 
 
-# ============================================================================
-# Arithmetic operators
-# ============================================================================
+# attrgetter fixtures, defined once at module level
+class Point:
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
 
-print("\n=== Arithmetic operators ===")
+class Container:
+    def __init__(self, point):
+        self.point = point
 
-test("add int", operator.add(1, 2) == 3)
-test("add float", abs(operator.add(1.5, 2.5) - 4.0) < 0.001)
-test("add str", operator.add("hello", " world") == "hello world")
-test("add list", operator.add([1, 2], [3, 4]) == [1, 2, 3, 4])
 
-test("sub", operator.sub(5, 3) == 2)
-test("sub negative", operator.sub(3, 5) == -2)
-test("sub float", abs(operator.sub(5.5, 2.5) - 3.0) < 0.001)
+# Names exported by operator, probed once instead of per-feature hasattr()
+_ops_present = set(dir(operator))
 
-test("mul int", operator.mul(3, 4) == 12)
-test("mul str", operator.mul("ab", 3) == "ababab")
-test("mul list", operator.mul([1, 2], 2) == [1, 2, 1, 2])
+# Tolerance for float comparisons
+_TOL = 1e-3
 
-test("truediv", abs(operator.truediv(7, 2) - 3.5) < 0.001)
-test("truediv float", abs(operator.truediv(7.0, 2.0) - 3.5) < 0.001)
 
-test("floordiv", operator.floordiv(7, 2) == 3)
-test("floordiv negative", operator.floordiv(-7, 2) == -4)
+def _close(got, want):
+    return abs(got - want) < _TOL
 
-test("mod", operator.mod(7, 3) == 1)
-test("mod negative", operator.mod(-7, 3) == 2)
 
-test("pow", operator.pow(2, 3) == 8)
-test("pow float", abs(operator.pow(2.0, 3.0) - 8.0) < 0.001)
+def run_cases(cases):
+    """Run (name, function, args, expected[, check]) rows through test()."""
+    eq = operator.eq  # default check, looked up once per table
+    for case in cases:
+        check = case[4] if len(case) == 5 else eq
+        test(case[0], check(case[1](*case[2]), case[3]))
 
-test("neg", operator.neg(5) == -5)
-test("neg negative", operator.neg(-5) == 5)
-test("neg float", abs(operator.neg(3.14) + 3.14) < 0.001)
 
-if hasattr(operator, "pos"):
+def run_predicates(cases):
+    """Run (name, function, args, holds) rows, testing the result's truth."""
+    for name, fn, args, holds in cases:
+        result = fn(*args)
+        test(name, result if holds else not result)
+
+
+# ============================================================================
+# Arithmetic operators
+# ============================================================================
+
+_w("\n=== Arithmetic operators ===\n")
+
+# Each case is (name, function, args, expected[, check]); check defaults to ==
+_ARITHMETIC_CASES = [
+    ("add int", operator.add, (1, 2), 3),
+    ("add float", operator.add, (1.5, 2.5), 4.0, _close),
+    ("add str", operator.add, ("hello", " world"), "hello world"),
+    ("add list", operator.add, ([1, 2], [3, 4]), [1, 2, 3, 4]),
+    ("sub", operator.sub, (5, 3), 2),
+    ("sub negative", operator.sub, (3, 5), -2),
+    ("sub float", operator.sub, (5.5, 2.5), 3.0, _close),
+    ("mul int", operator.mul, (3, 4), 12),
+    ("mul str", operator.mul, ("ab", 3), "ababab"),
+    ("mul list", operator.mul, ([1, 2], 2), [1, 2, 1, 2]),
+    ("truediv", operator.truediv, (7, 2), 3.5, _close),
+    ("truediv float", operator.truediv, (7.0, 2.0), 3.5, _close),
+    ("floordiv", operator.floordiv, (7, 2), 3),
+    ("floordiv negative", operator.floordiv, (-7, 2), -4),
+    ("mod", operator.mod, (7, 3), 1),
+    ("mod negative", operator.mod, (-7, 3), 2),
+    ("pow", operator.pow, (2, 3), 8),
+    ("pow float", operator.pow, (2.0, 3.0), 8.0, _close),
+    ("neg", operator.neg, (5,), -5),
+    ("neg negative", operator.neg, (-5,), 5),
+    ("neg float", operator.neg, (3.14,), -3.14, _close),
+]
+run_cases(_ARITHMETIC_CASES)
+
+if "pos" in _ops_present:
     test("pos", operator.pos(5) == 5)
     test("pos negative", operator.pos(-5) == -5)
 else:
-    skip("pos", "not available")
-    skip("pos negative", "not available")
+    for name in ("pos", "pos negative"):
+        skip(name, "not available")
 
-if hasattr(operator, "abs"):
+if "abs" in _ops_present:
     test("abs positive", operator.abs(5) == 5)
     test("abs negative", operator.abs(-5) == 5)
-    test("abs float", abs(operator.abs(-3.14) - 3.14) < 0.001)
+    test("abs float", abs(operator.abs(-3.14) - 3.14) < _TOL)
 else:
-    skip("abs positive", "not available")
-    skip("abs negative", "not available")
-    skip("abs float", "not available")
+    for name in ("positive", "negative", "float"):
+        skip("abs " + name, "not available")
 
-if hasattr(operator, "index"):
+if "index" in _ops_present:
     test("index", operator.index(5) == 5)
     test("index negative", operator.index(-5) == -5)
 else:
-    skip("index", "not available")
-    skip("index negative", "not available")
+    for name in ("index", "index negative"):
+        skip(name, "not available")
 
 
 # ============================================================================
 # Comparison operators
 # ============================================================================
 
-print("\n=== Comparison operators ===")
-
-test("lt true", operator.lt(1, 2) is True)
-test("lt false", operator.lt(2, 1) is False)
-test("lt equal", operator.lt(1, 1) is False)
-
-test("le true", operator.le(1, 2) is True)
-test("le equal", operator.le(1, 1) is True)
-test("le false", operator.le(2, 1) is False)
-
-test("eq true", operator.eq(1, 1) is True)
-test("eq false", operator.eq(1, 2) is False)
-test("eq str", operator.eq("a", "a") is True)
-
-test("ne true", operator.ne(1, 2) is True)
-test("ne false", operator.ne(1, 1) is False)
-
-test("ge true", operator.ge(2, 1) is True)
-test("ge equal", operator.ge(1, 1) is True)
-test("ge false", operator.ge(1, 2) is False)
-
-test("gt true", operator.gt(2, 1) is True)
-test("gt false", operator.gt(1, 2) is False)
-test("gt equal", operator.gt(1, 1) is False)
+_w("\n=== Comparison operators ===\n")
+
+_COMPARISON_CASES = [
+    ("lt true", operator.lt, (1, 2), True),
+    ("lt false", operator.lt, (2, 1), False),
+    ("lt equal", operator.lt, (1, 1), False),
+    ("le true", operator.le, (1, 2), True),
+    ("le equal", operator.le, (1, 1), True),
+    ("le false", operator.le, (2, 1), False),
+    ("eq true", operator.eq, (1, 1), True),
+    ("eq false", operator.eq, (1, 2), False),
+    ("eq str", operator.eq, ("a", "a"), True),
+    ("ne true", operator.ne, (1, 2), True),
+    ("ne false", operator.ne, (1, 1), False),
+    ("ge true", operator.ge, (2, 1), True),
+    ("ge equal", operator.ge, (1, 1), True),
+    ("ge false", operator.ge, (1, 2), False),
+    ("gt true", operator.gt, (2, 1), True),
+    ("gt false", operator.gt, (1, 2), False),
+    ("gt equal", operator.gt, (1, 1), False),
+]
+run_predicates(_COMPARISON_CASES)
 
 
 # ============================================================================
 # Logical/bitwise operators
 # ============================================================================
 
-print("\n=== Logical/bitwise operators ===")
-
-test("not_ false", operator.not_(False) is True)
-test("not_ true", operator.not_(True) is False)
-test("not_ zero", operator.not_(0) is True)
-test("not_ nonzero", operator.not_(1) is False)
-test("not_ empty", operator.not_([]) is True)
-test("not_ nonempty", operator.not_([1]) is False)
-
-test("truth false", operator.truth(False) is False)
-test("truth true", operator.truth(True) is True)
-test("truth zero", operator.truth(0) is False)
-test("truth nonzero", operator.truth(1) is True)
-
-test("and_ int", operator.and_(0b1100, 0b1010) == 0b1000)
-test("or_ int", operator.or_(0b1100, 0b1010) == 0b1110)
-test("xor int", operator.xor(0b1100, 0b1010) == 0b0110)
-
-test("invert", operator.invert(0) == -1)
-
-if hasattr(operator, "inv"):
+_w("\n=== Logical/bitwise operators ===\n")
+
+_TRUTH_CASES = [
+    ("not_ false", operator.not_, (False,), True),
+    ("not_ true", operator.not_, (True,), False),
+    ("not_ zero", operator.not_, (0,), True),
+    ("not_ nonzero", operator.not_, (1,), False),
+    ("not_ empty", operator.not_, ([],), True),
+    ("not_ nonempty", operator.not_, ([1],), False),
+    ("truth false", operator.truth, (False,), False),
+    ("truth true", operator.truth, (True,), True),
+    ("truth zero", operator.truth, (0,), False),
+]
+run_predicates(_TRUTH_CASES)
+
+# truth() must return the bool singleton, not the truthy int it was given
+test("truth nonzero", operator.is_(operator.truth(1), True))
+
+_BITWISE_CASES = [
+    ("and_ int", operator.and_, (0b1100, 0b1010), 0b1000),
+    ("or_ int", operator.or_, (0b1100, 0b1010), 0b1110),
+    ("xor int", operator.xor, (0b1100, 0b1010), 0b0110),
+    ("invert", operator.invert, (0,), -1),
+    ("lshift", operator.lshift, (1, 4), 16),
+    ("rshift", operator.rshift, (16, 2), 4),
+]
+run_cases(_BITWISE_CASES)
+
+if "inv" in _ops_present:
     test("inv", operator.inv(0) == -1)  # alias
 else:
     skip("inv", "not available")
 
-test("lshift", operator.lshift(1, 4) == 16)
-test("rshift", operator.rshift(16, 2) == 4)
-
 
 # ============================================================================
 # Identity operators
 # ============================================================================
 
-print("\n=== Identity operators ===")
+_w("\n=== Identity operators ===\n")
 
 a = [1, 2, 3]
 b = a
 c = [1, 2, 3]
 
-test("is_ same", operator.is_(a, b) is True)
-test("is_ different", operator.is_(a, c) is False)
-test("is_not same", operator.is_not(a, b) is False)
-test("is_not different", operator.is_not(a, c) is True)
+test("is_ same", operator.is_(a, b))
+test("is_ different", not operator.is_(a, c))
+test("is_not same", not operator.is_not(a, b))
+test("is_not different", operator.is_not(a, c))
 
-if hasattr(operator, "is_none"):
-    test("is_none true", operator.is_none(None) is True)
-    test("is_none false", operator.is_none(1) is False)
+if "is_none" in _ops_present:
+    test("is_none true", operator.is_none(None))
+    test("is_none false", not operator.is_none(1))
 else:
-    skip("is_none true", "not available")
-    skip("is_none false", "not available")
+    for name in ("true", "false"):
+        skip("is_none " + name, "not available")
 
-if hasattr(operator, "is_not_none"):
-    test("is_not_none true", operator.is_not_none(1) is True)
-    test("is_not_none false", operator.is_not_none(None) is False)
+if "is_not_none" in _ops_present:
+    test("is_not_none true", operator.is_not_none(1))
+    test("is_not_none false", not operator.is_not_none(None))
 else:
-    skip("is_not_none true", "not available")
-    skip("is_not_none false", "not available")
+    for name in ("true", "false"):
+        skip("is_not_none " + name, "not available")
 
 
 # ============================================================================
 # Sequence operators
 # ============================================================================
 
-print("\n=== Sequence operators ===")
+_w("\n=== Sequence operators ===\n")
+
+# Shared read-only operands; setitem/delitem build their own lists below
+_L123 = [1, 2, 3]
+_L1234 = [1, 2, 3, 4]
+_D_A1 = {"a": 1}
 
-if hasattr(operator, "concat"):
+if "concat" in _ops_present:
     test("concat list", operator.concat([1, 2], [3, 4]) == [1, 2, 3, 4])
     test("concat str", operator.concat("hello", " world") == "hello world")
 else:
-    skip("concat list", "not available")
-    skip("concat str", "not available")
+    for name in ("list", "str"):
+        skip("concat " + name, "not available")
 
-test("contains true", operator.contains([1, 2, 3], 2) is True)
-test("contains false", operator.contains([1, 2, 3], 4) is False)
-test("contains str", operator.contains("hello", "ll") is True)
+test("contains true", operator.contains(_L123, 2))
+test("contains false", not operator.contains(_L123, 4))
+test("contains str", operator.contains("hello", "ll"))
 
-if hasattr(operator, "countOf"):
+if "countOf" in _ops_present:
     test("countOf", operator.countOf([1, 2, 2, 3, 2], 2) == 3)
-    test("countOf zero", operator.countOf([1, 2, 3], 5) == 0)
+    test("countOf zero", operator.countOf(_L123, 5) == 0)
 else:
-    skip("countOf", "not available")
-    skip("countOf zero", "not available")
+    for name in ("countOf", "countOf zero"):
+        skip(name, "not available")
 
-if hasattr(operator, "indexOf"):
-    test("indexOf", operator.indexOf([1, 2, 3, 4], 3) == 2)
+if "indexOf" in _ops_present:
+    test("indexOf", operator.indexOf(_L1234, 3) == 2)
     test("indexOf first", operator.indexOf([1, 2, 3, 2], 2) == 1)
 
     # indexOf should raise ValueError if not found
     try:
-        operator.indexOf([1, 2, 3], 5)
+        operator.indexOf(_L123, 5)
         test("indexOf not found raises", False)
     except ValueError:
         test("indexOf not found raises", True)
 else:
-    skip("indexOf", "not available")
-    skip("indexOf first", "not available")
-    skip("indexOf not found raises", "not available")
+    for name in ("indexOf", "indexOf first", "indexOf not found raises"):
+        skip(name, "not available")
 
-test("getitem list", operator.getitem([1, 2, 3], 1) == 2)
-test("getitem dict", operator.getitem({"a": 1}, "a") == 1)
+test("getitem list", operator.getitem(_L123, 1) == 2)
+test("getitem dict", operator.getitem(_D_A1, "a") == 1)
 test("getitem str", operator.getitem("hello", 0) == "h")
 
 lst = [1, 2, 3]
@@ -246,7 +289,7 @@ test("delitem", lst == [1, 3])
 # In-place operators
 # ============================================================================
 
-print("\n=== In-place operators ===")
+_w("\n=== In-place operators ===\n")
 
 # For immutable types, in-place ops return new objects
 x = 5
@@ -259,7 +302,7 @@ x = 5
 test("imul", operator.imul(x, 3) == 15)
 
 x = 6
-test("itruediv", abs(operator.itruediv(x, 2) - 3.0) < 0.001)
+test("itruediv", abs(operator.itruediv(x, 2) - 3.0) < _TOL)
 
 x = 7
 test("ifloordiv", operator.ifloordiv(x, 2) == 3)
@@ -267,7 +310,7 @@ test("ifloordiv", operator.ifloordiv(x, 2) == 3)
 x = 7
 test("imod", operator.imod(x, 3) == 1)
 
-if hasattr(operator, "ipow"):
+if "ipow" in _ops_present:
     x = 2
     test("ipow", operator.ipow(x, 3) == 8)
 else:
@@ -289,7 +332,7 @@ x = 16
 test("irshift", operator.irshift(x, 2) == 4)
 
 # For mutable types, in-place ops modify in place
-if hasattr(operator, "iconcat"):
+if "iconcat" in _ops_present:
     lst = [1, 2]
     result = operator.iconcat(lst, [3, 4])
     test("iconcat", result == [1, 2, 3, 4])
@@ -301,9 +344,10 @@ else:
 # itemgetter
 # ============================================================================
 
-print("\n=== itemgetter ===")
+_w("\n=== itemgetter ===\n")
 
-if hasattr(operator, "itemgetter"):
+
+def _test_itemgetter():
     getter = operator.itemgetter(1)
     test("itemgetter single", getter([1, 2, 3]) == 2)
     test("itemgetter dict", getter({"a": 1, "b": 2, 1: 100}) == 100)
@@ -318,27 +362,23 @@ if hasattr(operator, "itemgetter"):
     data = [{"name": "Bob", "age": 30}, {"name": "Alice", "age": 25}]
     sorted_data = sorted(data, key=operator.itemgetter("age"))
     test("itemgetter sort", sorted_data[0]["name"] == "Alice")
+
+
+if "itemgetter" in _ops_present:
+    _test_itemgetter()
 else:
-    skip("itemgetter single", "not available")
-    skip("itemgetter dict", "not available")
-    skip("itemgetter multiple", "not available")
-    skip("itemgetter dict multiple", "not available")
-    skip("itemgetter sort", "not available")
+    for name in ("single", "dict", "multiple", "dict multiple", "sort"):
+        skip("itemgetter " + name, "not available")
 
 
 # ============================================================================
 # attrgetter
 # ============================================================================
 
-print("\n=== attrgetter ===")
-
-if hasattr(operator, "attrgetter"):
+_w("\n=== attrgetter ===\n")
 
-    class Point:
-        def __init__(self, x, y):
-            self.x = x
-            self.y = y
 
+def _test_attrgetter():
     p = Point(3, 4)
 
     getter = operator.attrgetter("x")
@@ -348,26 +388,26 @@ if hasattr(operator, "attrgetter"):
     test("attrgetter multiple", getter(p) == (3, 4))
 
     # Nested attribute access
-    class Container:
-        def __init__(self, point):
-            self.point = point
-
     c = Container(Point(1, 2))
     getter = operator.attrgetter("point.x")
     test("attrgetter nested", getter(c) == 1)
+
+
+if "attrgetter" in _ops_present:
+    _test_attrgetter()
 else:
-    skip("attrgetter single", "not available")
-    skip("attrgetter multiple", "not available")
-    skip("attrgetter nested", "not available")
+    for name in ("single", "multiple", "nested"):
+        skip("attrgetter " + name, "not available")
 
 
 # ============================================================================
 # methodcaller
 # ============================================================================
 
-print("\n=== methodcaller ===")
+_w("\n=== methodcaller ===\n")
+
 
-if hasattr(operator, "methodcaller"):
+def _test_methodcaller():
     caller = operator.methodcaller("upper")
     test("methodcaller no args", caller("hello") == "HELLO")
 
@@ -380,36 +420,37 @@ if hasattr(operator, "methodcaller"):
     # With keyword args - note: not all MicroPython methods support kwargs
     caller = operator.methodcaller("split")
     test("methodcaller default", caller("a b c") == ["a", "b", "c"])
+
+
+if "methodcaller" in _ops_present:
+    _test_methodcaller()
 else:
-    skip("methodcaller no args", "not available")
-    skip("methodcaller with args", "not available")
-    skip("methodcaller two args", "not available")
-    skip("methodcaller default", "not available")
+    for name in ("no args", "with args", "two args", "default"):
+        skip("methodcaller " + name, "not available")
 
 
 # ============================================================================
 # length_hint
 # ============================================================================
 
-print("\n=== length_hint ===")
+_w("\n=== length_hint ===\n")
 
-if hasattr(operator, "length_hint"):
+if "length_hint" in _ops_present:
     test("length_hint list", operator.length_hint([1, 2, 3]) == 3)
     test("length_hint str", operator.length_hint("hello") == 5)
     test("length_hint default", operator.length_hint(iter([]), 10) == 10)
 else:
-    skip("length_hint list", "not available")
-    skip("length_hint str", "not available")
-    skip("length_hint default", "not available")
+    for name in ("list", "str", "default"):
+        skip("length_hint " + name, "not available")
 
 
 # ============================================================================
 # call (Python 3.11+)
 # ============================================================================
 
-print("\n=== call ===")
+_w("\n=== call ===\n")
 
-if hasattr(operator, "call"):
+if "call" in _ops_present:
 
     def add(a, b):
         return a + b
@@ -417,20 +458,20 @@ if hasattr(operator, "call"):
     test("call function", operator.call(add, 1, 2) == 3)
     test("call builtin", operator.call(len, [1, 2, 3]) == 3)
 else:
-    skip("call function", "not available")
-    skip("call builtin", "not available")
+    for name in ("function", "builtin"):
+        skip("call " + name, "not available")
 
 
 # ============================================================================
 # Summary
 # ============================================================================
 
-print("\n" + "=" * 50)
-print(f"Results: {_passed} passed, {_failed} failed, {_skipped} skipped")
+_w("\n" + "=" * 50 + "\n")
+_w(f"Results: {_passed} passed, {_failed} failed, {_skipped} skipped\n")
 if _errors:
-    print("Failed tests:")
+    _w("Failed tests:\n")
     for e in _errors:
-        print(f"  - {e}")
+        _w(f"  - {e}\n")
     sys.exit(1)
 else:
-    print("All tests passed!")
+    _w("All tests passed!\n")
@@ -5,38 +5,29 @@ Works on both CPython and pocketpy-ucharm.
 Based on CPython's Lib/test/test_os.py
 """
 
+import errno
 import os
 import sys
 
-# Test tracking
-_passed = 0
-_failed = 0
-_errors = []
-_skipped = 0
-
-
-def test(name, condition):
-    global _passed, _failed, _errors
-    if condition:
-        _passed += 1
-        print(f"  PASS: {name}")
-    else:
-        _failed += 1
-        _errors.append(name)
-        print(f"  FAIL: {name}")
-
+try:
+    from _harness import section, skip, summary, test
+except ImportError:
+    print("ERROR: _harness not importable; run from tests/cpython")
+    sys.exit(1)
 
-def skip(name, reason):
-    global _skipped
-    _skipped += 1
-    print(f"  SKIP: {name} ({reason})")
+# os features probed once up front
+OS_CAPS = {
+    n
+    for n in ("mkdir", "rmdir", "remove", "stat", "open", "O_WRONLY")
+    if hasattr(os, n)
+}
 
 
 # ============================================================================
 # os.getcwd() tests
 # ============================================================================
 
-print("\n=== os.getcwd() tests ===")
+section("os.getcwd() tests")
 
 cwd = os.getcwd()
 test("getcwd returns string", isinstance(cwd, str))
@@ -48,90 +39,100 @@ test("getcwd is absolute", cwd.startswith("/") or (len(cwd) > 1 and cwd[1] == ":
 # os.listdir() tests
 # ============================================================================
 
-print("\n=== os.listdir() tests ===")
+section("os.listdir() tests")
 
 entries = os.listdir(".")
 test("listdir returns list", isinstance(entries, list))
 test("listdir has entries", len(entries) >= 0)
 
-# All entries are strings
-all_strings = True
-for e in entries:
-    if not isinstance(e, str):
-        all_strings = False
-        break
-test("listdir all strings", all_strings)
+
+def _all_strings(items):
+    """True if every item is a str; stops at the first one that is not."""
+    for item in items:
+        if not isinstance(item, str):
+            return False
+    return True
+
+
+test("listdir all strings", _all_strings(entries))
 
 
 # ============================================================================
 # os.path tests
 # ============================================================================
 
-print("\n=== os.path tests ===")
+section("os.path tests")
+
+# Bind os.path functions once; the calls below then skip two attribute lookups
+_exists = os.path.exists
+_isdir = os.path.isdir
+_isfile = os.path.isfile
+_join = os.path.join
+_basename = os.path.basename
+_dirname = os.path.dirname
+_split = os.path.split
+_splitext = os.path.splitext
+_isabs = os.path.isabs
+_abspath = os.path.abspath
+_normpath = os.path.normpath
 
 # exists
-test("path.exists cwd", os.path.exists("."))
-test("path.exists nonexistent", not os.path.exists("/nonexistent_path_12345"))
+test("path.exists cwd", _exists("."))
+test("path.exists nonexistent", not _exists("/nonexistent_path_12345"))
 
 # isdir
-test("path.isdir cwd", os.path.isdir("."))
+test("path.isdir cwd", _isdir("."))
 
 # isfile
-test("path.isfile cwd", not os.path.isfile("."))
-
-# join
-test("path.join two", os.path.join("a", "b") in ["a/b", "a\\b"])
-test("path.join three", os.path.join("a", "b", "c") in ["a/b/c", "a\\b\\c"])
-test(
-    "path.join absolute",
-    os.path.join("a", "/b") == "/b" or os.path.join("a", "/b") == "\\b",
+test("path.isfile cwd", not _isfile("."))
+
+# Pure string manipulation, driven from tables built once. PATH_CASES rows
+# are (name, function, args, accepted results); separator-dependent cases
+# list both spellings.
+PATH_CASES = (
+    ("path.join two", _join, ("a", "b"), ("a/b", "a\\b")),
+    ("path.join three", _join, ("a", "b", "c"), ("a/b/c", "a\\b\\c")),
+    ("path.join absolute", _join, ("a", "/b"), ("/b", "\\b")),
+    ("path.basename", _basename, ("/foo/bar",), ("bar",)),
+    ("path.basename no dir", _basename, ("bar",), ("bar",)),
+    ("path.basename trailing slash", _basename, ("/foo/bar/",), ("",)),
+    ("path.dirname", _dirname, ("/foo/bar",), ("/foo",)),
+    ("path.dirname no dir", _dirname, ("bar",), ("",)),
+    ("path.isabs absolute", _isabs, ("/foo",), (True,)),
+    ("path.isabs relative", _isabs, ("foo",), (False,)),
+    ("path.normpath dots", _normpath, ("a/./b",), ("a/b", "a\\b")),
+    ("path.normpath dotdot", _normpath, ("a/b/../c",), ("a/c", "a\\c")),
 )
-
-# basename
-test("path.basename", os.path.basename("/foo/bar") == "bar")
-test("path.basename no dir", os.path.basename("bar") == "bar")
-test("path.basename trailing slash", os.path.basename("/foo/bar/") == "")
-
-# dirname
-test("path.dirname", os.path.dirname("/foo/bar") == "/foo")
-test("path.dirname no dir", os.path.dirname("bar") == "")
-
-# split
-head, tail = os.path.split("/foo/bar")
-test("path.split head", head == "/foo")
-test("path.split tail", tail == "bar")
-
-# splitext
-root, ext = os.path.splitext("/foo/bar.txt")
-test("path.splitext root", root == "/foo/bar")
-test("path.splitext ext", ext == ".txt")
-
-root, ext = os.path.splitext("/foo/bar")
-test("path.splitext no ext", ext == "")
-
-# isabs
-test("path.isabs absolute", os.path.isabs("/foo"))
-test("path.isabs relative", not os.path.isabs("foo"))
+for name, fn, args, accepted in PATH_CASES:
+    test(name, fn(*args) in accepted)
+
+# split/splitext return pairs; rows are (name, function, args, index, expected)
+PAIR_CASES = (
+    ("path.split head", _split, ("/foo/bar",), 0, "/foo"),
+    ("path.split tail", _split, ("/foo/bar",), 1, "bar"),
+    ("path.splitext root", _splitext, ("/foo/bar.txt",), 0, "/foo/bar"),
+    ("path.splitext ext", _splitext, ("/foo/bar.txt",), 1, ".txt"),
+    ("path.splitext no ext", _splitext, ("/foo/bar",), 1, ""),
+)
+for name, fn, args, i, expected in PAIR_CASES:
+    test(name, fn(*args)[i] == expected)
 
 # abspath
-abs_path = os.path.abspath(".")
-test("path.abspath is absolute", os.path.isabs(abs_path))
-
-# normpath
-test("path.normpath dots", os.path.normpath("a/./b") in ["a/b", "a\\b"])
-test("path.normpath dotdot", os.path.normpath("a/b/../c") in ["a/c", "a\\c"])
+abs_path = _abspath(".")
+test("path.abspath is absolute", _isabs(abs_path))
 
 
 # ============================================================================
 # os.environ tests
 # ============================================================================
 
-print("\n=== os.environ tests ===")
+section("os.environ tests")
 
 test("environ is dict-like", hasattr(os.environ, "__getitem__"))
 
-# PATH or HOME should exist on most systems
-has_path = "PATH" in os.environ or "HOME" in os.environ or "USER" in os.environ
+# PATH or HOME should exist on most systems; snapshot the keys once
+env_keys = set(os.environ.keys())
+has_path = bool(env_keys & {"PATH", "HOME", "USER"})
 test("environ has common vars", has_path)
 
 # getenv
@@ -150,83 +151,100 @@ test("getenv nonexistent none", os.getenv("NONEXISTENT_VAR_12345") is None)
 # os.sep and os.name tests
 # ============================================================================
 
-print("\n=== os.sep and os.name tests ===")
+section("os.sep and os.name tests")
 
 test("sep is string", isinstance(os.sep, str))
-test("sep is / or \\", os.sep in ["/", "\\"])
+test("sep is / or \\", os.sep in ("/", "\\"))
 
 test("name is string", isinstance(os.name, str))
-test("name is known", os.name in ["posix", "nt", "java"])
+test("name is known", os.name in ("posix", "nt", "java"))
 
 test("linesep is string", isinstance(os.linesep, str))
-test("linesep is newline", os.linesep in ["\n", "\r\n", "\r"])
+test("linesep is newline", os.linesep in ("\n", "\r\n", "\r"))
 
 
 # ============================================================================
 # File descriptor operations
 # ============================================================================
 
-print("\n=== File operations ===")
+section("File operations")
+
 
 # mkdir/rmdir
-test_dir = "/tmp/ucharm_test_dir_12345"
-try:
-    if os.path.exists(test_dir):
+if "mkdir" in OS_CAPS and "rmdir" in OS_CAPS:
+    test_dir = "/tmp/ucharm_test_dir_12345"
+    try:
+        try:
+            os.mkdir(test_dir)
+        except OSError as e:
+            # Only recover from a directory left over by an earlier run
+            if not e.args or e.args[0] != errno.EEXIST:
+                raise
+            os.rmdir(test_dir)
+            os.mkdir(test_dir)
+        test("mkdir creates dir", _isdir(test_dir))
         os.rmdir(test_dir)
-    os.mkdir(test_dir)
-    test("mkdir creates dir", os.path.exists(test_dir))
-    os.rmdir(test_dir)
-    test("rmdir removes dir", not os.path.exists(test_dir))
-except (OSError, PermissionError) as e:
-    skip("mkdir/rmdir", str(e))
+        test("rmdir removes dir", not _isdir(test_dir))
+    except (OSError, PermissionError) as e:
+        skip("mkdir/rmdir", str(e))
+else:
+    skip("mkdir/rmdir", "not available")
 
 # remove/unlink
-test_file = "/tmp/ucharm_test_file_12345.txt"
-try:
-    with open(test_file, "w") as f:
-        f.write("test")
-    exists_before = os.path.exists(test_file)
-    os.remove(test_file)
-    exists_after = os.path.exists(test_file)
-    test("remove deletes file", exists_before and not exists_after)
-except (OSError, PermissionError) as e:
-    skip("remove/unlink", str(e))
+if "remove" in OS_CAPS:
+    test_file = "/tmp/ucharm_test_file_12345.txt"
+    try:
+        if "open" in OS_CAPS and "O_WRONLY" in OS_CAPS:
+            # Raw fd write: no TextIOWrapper for a 4-byte payload. No try/finally
+            # around it, PocketPy does not support finally clauses.
+            fd = os.open(test_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            os.write(fd, b"test")
+            os.close(fd)
+        else:
+            with open(test_file, "w") as f:
+                f.write("test")
+        # os.remove raises if the file is missing, so returning at all shows
+        # it existed. The follow-up check stays on os.path.exists: os.stat on
+        # a missing path crashes pocketpy-ucharm instead of raising.
+        os.remove(test_file)
+        test("remove deletes file", not _exists(test_file))
+    except (OSError, PermissionError) as e:
+        skip("remove/unlink", str(e))
+else:
+    skip("remove/unlink", "not available")
 
 
 # ============================================================================
 # os.stat tests
 # ============================================================================
 
-print("\n=== os.stat tests ===")
-
-try:
-    st = os.stat(".")
-    test("stat returns object", st is not None)
-
-    # Check common stat attributes
-    if hasattr(st, "st_mode"):
-        test("stat has st_mode", isinstance(st.st_mode, int))
-    elif isinstance(st, tuple) and len(st) >= 1:
-        test("stat has st_mode", isinstance(st[0], int))
-
-    if hasattr(st, "st_size"):
-        test("stat has st_size", isinstance(st.st_size, int))
-    elif isinstance(st, tuple) and len(st) >= 7:
-        test("stat has st_size", isinstance(st[6], int))
-except OSError as e:
-    skip("stat tests", str(e))
+section("os.stat tests")
+
+if "stat" in OS_CAPS:
+    try:
+        st = os.stat(".")
+        test("stat returns object", st is not None)
+
+        # Check common stat fields; PocketPy returns a plain tuple, CPython
+        # a stat_result with named attributes
+        if type(st) is tuple:
+            mode = st[0] if len(st) >= 1 else None
+            size = st[6] if len(st) >= 7 else None
+        else:
+            mode = getattr(st, "st_mode", None)
+            size = getattr(st, "st_size", None)
+        if mode is not None:
+            test("stat has st_mode", isinstance(mode, int))
+        if size is not None:
+            test("stat has st_size", isinstance(size, int))
+    except OSError as e:
+        skip("stat tests", str(e))
+else:
+    skip("stat tests", "not available")
 
 
 # ============================================================================
 # Summary
 # ============================================================================
 
-print("\n" + "=" * 50)
-print(f"Results: {_passed} passed, {_failed} failed, {_skipped} skipped")
-if _errors:
-    print("Failed tests:")
-    for e in _errors:
-        print(f"  - {e}")
-    sys.exit(1)
-else:
-    print("All tests passed!")
+sys.exit(summary())
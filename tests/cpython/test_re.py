@@ -8,329 +8,299 @@ Based on CPython's Lib/test/test_re.py
 import re
 import sys
 
-# Test tracking
-_passed = 0
-_failed = 0
-_errors = []
-_skipped = 0
-
-
-def test(name, condition):
-    global _passed, _failed, _errors
-    if condition:
-        _passed += 1
-        print(f"  PASS: {name}")
-    else:
-        _failed += 1
-        _errors.append(name)
-        print(f"  FAIL: {name}")
-
-
-def skip(name, reason):
-    global _skipped
-    _skipped += 1
-    print(f"  SKIP: {name} ({reason})")
-
-
-# ============================================================================
-# re.match() tests
-# ============================================================================
-
-print("\n=== re.match() tests ===")
-
-# Basic match
-m = re.match(r"hello", "hello world")
-test("match basic", m is not None)
-test("match group", m.group(0) == "hello")
-
-# Match at start only
-m = re.match(r"world", "hello world")
-test("match start only", m is None)
-
-# Match with groups
-m = re.match(r"(\w+) (\w+)", "hello world")
-test("match groups", m is not None)
-test("match group 0", m.group(0) == "hello world")
-test("match group 1", m.group(1) == "hello")
-test("match group 2", m.group(2) == "world")
-
-# No match
-m = re.match(r"xyz", "hello")
-test("match no match", m is None)
-
-
-# ============================================================================
-# re.search() tests
-# ============================================================================
-
-print("\n=== re.search() tests ===")
-
-# Basic search
-m = re.search(r"world", "hello world")
-test("search basic", m is not None)
-test("search group", m.group(0) == "world")
-
-# Search anywhere in string
-m = re.search(r"o", "hello")
-test("search middle", m is not None)
-test("search start", m.start(0) == 4)
-
-# Search with groups
-m = re.search(r"(\d+)", "abc 123 def")
-test("search groups", m is not None)
-test("search group 1", m.group(1) == "123")
-
-# No match
-m = re.search(r"xyz", "hello")
-test("search no match", m is None)
-
-
-# ============================================================================
-# re.findall() tests
-# ============================================================================
-
-print("\n=== re.findall() tests ===")
-
-# Find all occurrences
-result = re.findall(r"\d+", "a1b2c3d4")
-test("findall basic", result == ["1", "2", "3", "4"])
-
-# No matches
-result = re.findall(r"\d+", "no numbers here")
-test("findall no match", result == [])
-
-# With groups (returns groups)
-result = re.findall(r"(\w)(\d)", "a1b2c3")
-test("findall groups", result == [("a", "1"), ("b", "2"), ("c", "3")])
-
-# Single group (returns list of strings)
-result = re.findall(r"(\d+)", "a1b22c333")
-test("findall single group", result == ["1", "22", "333"])
-
-
-# ============================================================================
-# re.sub() tests
-# ============================================================================
-
-print("\n=== re.sub() tests ===")
-
-# Basic substitution
-result = re.sub(r"\d+", "X", "a1b2c3")
-test("sub basic", result == "aXbXcX")
-
-# No match - unchanged
-result = re.sub(r"\d+", "X", "abc")
-test("sub no match", result == "abc")
-
-# Count argument (use positional arg for pocketpy compatibility)
-result = re.sub(r"\d+", "X", "a1b2c3", 2)
-test("sub count", result == "aXbXc3")
-
-# Empty replacement
-result = re.sub(r"\d+", "", "a1b2c3")
-test("sub empty replacement", result == "abc")
-
-# Replace with backreference
-result = re.sub(r"(\w+)", r"[\1]", "hello world")
-test("sub backreference", result == "[hello] [world]")
-
-
-# ============================================================================
-# re.split() tests
-# ============================================================================
-
-print("\n=== re.split() tests ===")
-
-# Basic split
-result = re.split(r"\s+", "hello world foo")
-test("split basic", result == ["hello", "world", "foo"])
-
-# Split on digits
-result = re.split(r"\d+", "a1b2c3d")
-test("split digits", result == ["a", "b", "c", "d"])
-
-# No match - single element
-result = re.split(r"x", "hello")
-test("split no match", result == ["hello"])
-
-# Split with maxsplit (use positional arg for pocketpy compatibility)
-result = re.split(r"\s+", "a b c d", 2)
-test("split maxsplit", result == ["a", "b", "c d"])
-
-# Empty string
-result = re.split(r"\s+", "")
-test("split empty", result == [""])
-
-
-# ============================================================================
-# re.compile() tests
-# ============================================================================
-
-print("\n=== re.compile() tests ===")
-
-# Compile pattern
-pattern = re.compile(r"\d+")
-test("compile returns pattern", pattern is not None)
-
-# Use compiled pattern
-m = pattern.match("123abc")
-test("compile match", m is not None and m.group(0) == "123")
-
-m = pattern.search("abc123def")
-test("compile search", m is not None and m.group(0) == "123")
-
-result = pattern.findall("a1b2c3")
-test("compile findall", result == ["1", "2", "3"])
+try:
+    from _harness import section, skip, summary, test
+except ImportError:
+    print("ERROR: _harness not importable; run from tests/cpython")
+    sys.exit(1)
 
-# Pattern.sub and Pattern.split - check if available
-if hasattr(pattern, "sub"):
-    result = pattern.sub("X", "a1b2c3")
-    test("compile sub", result == "aXbXcX")
-else:
-    skip("compile sub", "Pattern.sub not available in pocketpy")
 
-if hasattr(pattern, "split"):
-    result = pattern.split("a1b2c3d")
-    test("compile split", result == ["a", "b", "c", "d"])
-else:
-    skip("compile split", "Pattern.split not available in pocketpy")
+def main():
+    # ========================================================================
+    # re.match() tests
+    # ========================================================================
 
+    section("re.match() tests")
 
-# ============================================================================
-# Match object tests
-# ============================================================================
+    # Basic match
+    m = re.match(r"hello", "hello world")
+    test("match basic", m is not None)
+    test("match group", m.group(0) == "hello")
 
-print("\n=== Match object tests ===")
+    # Match at start only
+    m = re.match(r"world", "hello world")
+    test("match start only", m is None)
 
-m = re.match(r"(\w+) (\w+)", "hello world extra")
+    # Match with groups
+    m = re.match(r"(\w+) (\w+)", "hello world")
+    test("match groups", m is not None)
+    test("match group 0", m.group(0) == "hello world")
+    test("match group 1", m.group(1) == "hello")
+    test("match group 2", m.group(2) == "world")
 
-# group()
-test("match.group(0)", m.group(0) == "hello world")
-test("match.group(1)", m.group(1) == "hello")
-test("match.group(2)", m.group(2) == "world")
+    # No match
+    m = re.match(r"xyz", "hello")
+    test("match no match", m is None)
 
-# group() without argument
-test("match.group()", m.group() == "hello world")
+    # ========================================================================
+    # re.search() tests
+    # ========================================================================
 
-# groups()
-test("match.groups()", m.groups() == ("hello", "world"))
+    section("re.search() tests")
 
-# start() and end()
-test("match.start()", m.start(0) == 0)
-test("match.end()", m.end(0) == 11)
-test("match.start(1)", m.start(1) == 0)
-test("match.end(1)", m.end(1) == 5)
+    # Basic search
+    m = re.search(r"world", "hello world")
+    test("search basic", m is not None)
+    test("search group", m.group(0) == "world")
 
-# span()
-test("match.span()", m.span(0) == (0, 11))
-test("match.span(1)", m.span(1) == (0, 5))
+    # Search anywhere in string
+    m = re.search(r"o", "hello")
+    test("search middle", m is not None)
+    test("search start", m.start(0) == 4)
 
+    # Search with groups
+    m = re.search(r"(\d+)", "abc 123 def")
+    test("search groups", m is not None)
+    test("search group 1", m.group(1) == "123")
 
-# ============================================================================
-# Character classes
-# ============================================================================
+    # No match
+    m = re.search(r"xyz", "hello")
+    test("search no match", m is None)
 
-print("\n=== Character classes ===")
+    # ========================================================================
+    # re.findall() tests
+    # ========================================================================
 
-# \d - digits
-test("\\d matches digit", re.match(r"\d", "5") is not None)
-test("\\d no match letter", re.match(r"\d", "a") is None)
+    section("re.findall() tests")
 
-# \w - word characters
-test("\\w matches letter", re.match(r"\w", "a") is not None)
-test("\\w matches digit", re.match(r"\w", "5") is not None)
-test("\\w matches underscore", re.match(r"\w", "_") is not None)
-test("\\w no match space", re.match(r"\w", " ") is None)
+    # Find all occurrences
+    result = re.findall(r"\d+", "a1b2c3d4")
+    test("findall basic", result == ["1", "2", "3", "4"])
 
-# \s - whitespace
-test("\\s matches space", re.match(r"\s", " ") is not None)
-test("\\s matches tab", re.match(r"\s", "\t") is not None)
-test("\\s no match letter", re.match(r"\s", "a") is None)
+    # No matches
+    result = re.findall(r"\d+", "no numbers here")
+    test("findall no match", result == [])
 
-# Character set
-test("[abc] matches", re.match(r"[abc]", "b") is not None)
-test("[abc] no match", re.match(r"[abc]", "d") is None)
+    # With groups (returns groups)
+    result = re.findall(r"(\w)(\d)", "a1b2c3")
+    test("findall groups", result == [("a", "1"), ("b", "2"), ("c", "3")])
 
-# Negated set
-test("[^abc] matches", re.match(r"[^abc]", "d") is not None)
-test("[^abc] no match", re.match(r"[^abc]", "a") is None)
+    # Single group (returns list of strings)
+    result = re.findall(r"(\d+)", "a1b22c333")
+    test("findall single group", result == ["1", "22", "333"])
 
-# Range
-test("[a-z] matches", re.match(r"[a-z]", "m") is not None)
-test("[0-9] matches", re.match(r"[0-9]", "5") is not None)
+    # ========================================================================
+    # re.sub() tests
+    # ========================================================================
 
+    section("re.sub() tests")
 
-# ============================================================================
-# Quantifiers
-# ============================================================================
+    # Basic substitution
+    result = re.sub(r"\d+", "X", "a1b2c3")
+    test("sub basic", result == "aXbXcX")
 
-print("\n=== Quantifiers ===")
+    # No match - unchanged
+    result = re.sub(r"\d+", "X", "abc")
+    test("sub no match", result == "abc")
 
-# * - zero or more
-test("* matches zero", re.match(r"ab*c", "ac") is not None)
-test("* matches one", re.match(r"ab*c", "abc") is not None)
-test("* matches many", re.match(r"ab*c", "abbbc") is not None)
+    # Count argument (use positional arg for pocketpy compatibility)
+    result = re.sub(r"\d+", "X", "a1b2c3", 2)
+    test("sub count", result == "aXbXc3")
 
-# + - one or more
-test("+ no match zero", re.match(r"ab+c", "ac") is None)
-test("+ matches one", re.match(r"ab+c", "abc") is not None)
-test("+ matches many", re.match(r"ab+c", "abbbc") is not None)
+    # Empty replacement
+    result = re.sub(r"\d+", "", "a1b2c3")
+    test("sub empty replacement", result == "abc")
 
-# ? - zero or one
-test("? matches zero", re.match(r"ab?c", "ac") is not None)
-test("? matches one", re.match(r"ab?c", "abc") is not None)
-test("? no match many", re.match(r"ab?c$", "abbc") is None)
+    # Replace with backreference
+    result = re.sub(r"(\w+)", r"[\1]", "hello world")
+    test("sub backreference", result == "[hello] [world]")
 
-# {n} - exactly n
-test("{2} matches", re.match(r"ab{2}c", "abbc") is not None)
-test("{2} no match", re.match(r"ab{2}c", "abc") is None)
+    # ========================================================================
+    # re.split() tests
+    # ========================================================================
 
+    section("re.split() tests")
 
-# ============================================================================
-# Anchors
-# ============================================================================
+    # Basic split
+    result = re.split(r"\s+", "hello world foo")
+    test("split basic", result == ["hello", "world", "foo"])
 
-print("\n=== Anchors ===")
+    # Split on digits
+    result = re.split(r"\d+", "a1b2c3d")
+    test("split digits", result == ["a", "b", "c", "d"])
 
-# ^ - start of string
-test("^ at start", re.match(r"^hello", "hello world") is not None)
+    # No match - single element
+    result = re.split(r"x", "hello")
+    test("split no match", result == ["hello"])
 
-# $ - end of string
-test("$ at end", re.search(r"world$", "hello world") is not None)
-test("$ not at end", re.search(r"hello$", "hello world") is None)
+    # Split with maxsplit (use positional arg for pocketpy compatibility)
+    result = re.split(r"\s+", "a b c d", 2)
+    test("split maxsplit", result == ["a", "b", "c d"])
 
+    # Empty string
+    result = re.split(r"\s+", "")
+    test("split empty", result == [""])
 
-# ============================================================================
-# Edge cases
-# ============================================================================
+    # ========================================================================
+    # re.compile() tests
+    # ========================================================================
 
-print("\n=== Edge cases ===")
+    section("re.compile() tests")
 
-# Empty pattern
-m = re.match(r"", "hello")
-test("empty pattern matches", m is not None)
+    # Compile pattern
+    pattern = re.compile(r"\d+")
+    test("compile returns pattern", pattern is not None)
 
-# Empty string
-m = re.match(r".*", "")
-test("empty string matches", m is not None)
+    # Use compiled pattern
+    m = pattern.match("123abc")
+    test("compile match", m is not None and m.group(0) == "123")
 
-# Special characters
-m = re.match(r"\.", ".")
-test("escaped dot matches", m is not None)
-m = re.match(r"\.", "a")
-test("escaped dot no match", m is None)
+    m = pattern.search("abc123def")
+    test("compile search", m is not None and m.group(0) == "123")
 
+    result = pattern.findall("a1b2c3")
+    test("compile findall", result == ["1", "2", "3"])
 
-# ============================================================================
-# Summary
-# ============================================================================
+    # Pattern.sub and Pattern.split - check if available
+    if hasattr(pattern, "sub"):
+        result = pattern.sub("X", "a1b2c3")
+        test("compile sub", result == "aXbXcX")
+    else:
+        skip("compile sub", "Pattern.sub not available in pocketpy")
 
-print("\n" + "=" * 50)
-print(f"Results: {_passed} passed, {_failed} failed, {_skipped} skipped")
-if _errors:
-    print("Failed tests:")
-    for e in _errors:
-        print(f"  - {e}")
-    sys.exit(1)
-else:
-    print("All tests passed!")
+    if hasattr(pattern, "split"):
+        result = pattern.split("a1b2c3d")
+        test("compile split", result == ["a", "b", "c", "d"])
+    else:
+        skip("compile split", "Pattern.split not available in pocketpy")
+
+    # ========================================================================
+    # Match object tests
+    # ========================================================================
+
+    section("Match object tests")
+
+    m = re.match(r"(\w+) (\w+)", "hello world extra")
+
+    # group()
+    test("match.group(0)", m.group(0) == "hello world")
+    test("match.group(1)", m.group(1) == "hello")
+    test("match.group(2)", m.group(2) == "world")
+
+    # group() without argument
+    test("match.group()", m.group() == "hello world")
+
+    # groups()
+    test("match.groups()", m.groups() == ("hello", "world"))
+
+    # start() and end()
+    test("match.start()", m.start(0) == 0)
+    test("match.end()", m.end(0) == 11)
+    test("match.start(1)", m.start(1) == 0)
+    test("match.end(1)", m.end(1) == 5)
+
+    # span()
+    test("match.span()", m.span(0) == (0, 11))
+    test("match.span(1)", m.span(1) == (0, 5))
+
+    # ========================================================================
+    # Character classes
+    # ========================================================================
+
+    section("Character classes")
+
+    # Patterns compiled once; the tables hold (name, pattern, input, matches)
+    _P_D = re.compile(r"\d")
+    _P_W = re.compile(r"\w")
+    _P_S = re.compile(r"\s")
+    _P_ABC = re.compile(r"[abc]")
+    _P_NOT_ABC = re.compile(r"[^abc]")
+    _P_LOWER = re.compile(r"[a-z]")
+    _P_DIGIT_SET = re.compile(r"[0-9]")
+
+    _CHAR_CASES = (
+        ("\\d matches digit", _P_D, "5", True),
+        ("\\d no match letter", _P_D, "a", False),
+        ("\\w matches letter", _P_W, "a", True),
+        ("\\w matches digit", _P_W, "5", True),
+        ("\\w matches underscore", _P_W, "_", True),
+        ("\\w no match space", _P_W, " ", False),
+        ("\\s matches space", _P_S, " ", True),
+        ("\\s matches tab", _P_S, "\t", True),
+        ("\\s no match letter", _P_S, "a", False),
+        ("[abc] matches", _P_ABC, "b", True),
+        ("[abc] no match", _P_ABC, "d", False),
+        ("[^abc] matches", _P_NOT_ABC, "d", True),
+        ("[^abc] no match", _P_NOT_ABC, "a", False),
+        ("[a-z] matches", _P_LOWER, "m", True),
+        ("[0-9] matches", _P_DIGIT_SET, "5", True),
+    )
+    for name, pat, s, expected in _CHAR_CASES:
+        test(name, (pat.match(s) is not None) == expected)
+
+    # ========================================================================
+    # Quantifiers
+    # ========================================================================
+
+    section("Quantifiers")
+
+    _P_AB_STAR_C = re.compile(r"ab*c")
+    _P_AB_PLUS_C = re.compile(r"ab+c")
+    _P_AB_OPT_C = re.compile(r"ab?c")
+    _P_AB_OPT_C_END = re.compile(r"ab?c$")
+    _P_AB2C = re.compile(r"ab{2}c")
+
+    _QUANT_CASES = (
+        ("* matches zero", _P_AB_STAR_C, "ac", True),
+        ("* matches one", _P_AB_STAR_C, "abc", True),
+        ("* matches many", _P_AB_STAR_C, "abbbc", True),
+        ("+ no match zero", _P_AB_PLUS_C, "ac", False),
+        ("+ matches one", _P_AB_PLUS_C, "abc", True),
+        ("+ matches many", _P_AB_PLUS_C, "abbbc", True),
+        ("? matches zero", _P_AB_OPT_C, "ac", True),
+        ("? matches one", _P_AB_OPT_C, "abc", True),
+        ("? no match many", _P_AB_OPT_C_END, "abbc", False),
+        ("{2} matches", _P_AB2C, "abbc", True),
+        ("{2} no match", _P_AB2C, "abc", False),
+    )
+    for name, pat, s, expected in _QUANT_CASES:
+        test(name, (pat.match(s) is not None) == expected)
+
+    # ========================================================================
+    # Anchors
+    # ========================================================================
+
+    section("Anchors")
+
+    # ^ - start of string
+    test("^ at start", re.match(r"^hello", "hello world") is not None)
+
+    # $ - end of string
+    test("$ at end", re.search(r"world$", "hello world") is not None)
+    test("$ not at end", re.search(r"hello$", "hello world") is None)
+
+    # ========================================================================
+    # Edge cases
+    # ========================================================================
+
+    section("Edge cases")
+
+    # Empty pattern
+    m = re.match(r"", "hello")
+    test("empty pattern matches", m is not None)
+
+    # Empty string
+    m = re.match(r".*", "")
+    test("empty string matches", m is not None)
+
+    # Special characters
+    m = re.match(r"\.", ".")
+    test("escaped dot matches", m is not None)
+    m = re.match(r"\.", "a")
+    test("escaped dot no match", m is None)
+
+    return summary()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
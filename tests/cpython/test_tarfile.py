@@ -5,28 +5,11 @@ Works on both CPython and pocketpy-ucharm.
 
 import sys
 
-_passed = 0
-_failed = 0
-_errors = []
-_skipped = 0
-
-
-def test(name, condition):
-    global _passed, _failed, _errors
-    if condition:
-        _passed += 1
-        print(f"  PASS: {name}")
-    else:
-        _failed += 1
-        _errors.append(name)
-        print(f"  FAIL: {name}")
-
-
-def skip(name, reason):
-    global _skipped
-    _skipped += 1
-    print(f"  SKIP: {name} ({reason})")
-
+try:
+    from _harness import note, section, skip_many, summary, test
+except ImportError:
+    print("ERROR: _harness not importable; run from tests/cpython")
+    sys.exit(1)
 
 try:
     import tarfile as tarfile_mod
@@ -37,122 +20,145 @@ except ImportError:
     print("SKIP: tarfile module not available")
 
 if HAS_TARFILE:
-    print("\n=== tarfile.open/is_tarfile ===")
-    test("has open", hasattr(tarfile_mod, "open") and callable(tarfile_mod.open))
-    test(
-        "has is_tarfile",
-        hasattr(tarfile_mod, "is_tarfile") and callable(tarfile_mod.is_tarfile),
+    section("tarfile.open/is_tarfile")
+    has_open = hasattr(tarfile_mod, "open") and callable(tarfile_mod.open)
+    has_is_tarfile = hasattr(tarfile_mod, "is_tarfile") and callable(
+        tarfile_mod.is_tarfile
     )
+    test("has open", has_open)
+    test("has is_tarfile", has_is_tarfile)
+
+    # Use the builtin where there is one; pocketpy-ucharm has no oct() and
+    # no "%o" formatting, so it keeps a digit loop
+    try:
+        oct(0)
 
-    def _oct(n):
-        if n == 0:
-            return "0"
-        s = ""
-        while n > 0:
-            s = chr(ord("0") + (n & 7)) + s
-            n //= 8
-        return s
-
-    def _sum_bytes(b):
-        total = 0
-        i = 0
-        while i < len(b):
-            total += b[i]
-            i += 1
-        return total
+        def _oct(n):
+            return oct(n)[2:]
+
+    except NameError:
+
+        def _oct(n):
+            if n == 0:
+                return "0"
+            digits = []
+            while n > 0:
+                digits.append("01234567"[n & 7])
+                n >>= 3
+            return "".join(digits)[::-1]
+
+    # sum() over bytes runs in C on CPython; pocketpy-ucharm bytes are not
+    # iterable (and there is no memoryview), so it keeps the index loop
+    try:
+        sum(b"")
+        _sum_bytes = sum
+    except TypeError:
+
+        def _sum_bytes(b):
+            total = 0
+            i = 0
+            while i < len(b):
+                total += b[i]
+                i += 1
+            return total
+
+    # b"".join builds the result in one allocation on CPython; pocketpy-ucharm
+    # bytes have no join(), so it falls back to concatenation
+    try:
+        _join_bytes = b"".join
+    except AttributeError:
+
+        def _join_bytes(parts):
+            out = b""
+            for part in parts:
+                out += part
+            return out
+
+    # Header fields that are the same for every member, built once
+    _NUL100 = b"\x00" * 100
+    _MODE_UID_GID = b"0000644\x00" + b"0000000\x00" + b"0000000\x00"
+    _HDR_TAIL = _join_bytes(
+        (
+            b"00000000000\x00",  # mtime
+            b"        ",  # chksum placeholder
+            b"0",  # typeflag
+            _NUL100,  # linkname
+            b"ustar\x00",  # magic
+            b"00",  # version
+            b"\x00" * 32,  # uname
+            b"\x00" * 32,  # gname
+            b"\x00" * 8,  # devmajor
+            b"\x00" * 8,  # devminor
+            b"\x00" * 155,  # prefix
+            b"\x00" * 12,  # pad
+        )
+    )
 
     def _ustar_header(name, size):
         name_b = name.encode()
         if len(name_b) > 100:
             name_b = name_b[:100]
-        name_field = name_b + (b"\x00" * (100 - len(name_b)))
-        mode_field = b"0000644\x00"
-        uid_field = b"0000000\x00"
-        gid_field = b"0000000\x00"
-        size_o = _oct(size)
-        if len(size_o) > 11:
-            size_o = size_o[-11:]
-        size_field = (("0" * (11 - len(size_o))) + size_o + "\x00").encode()
-        mtime_field = b"00000000000\x00"
-        chksum_field = b"        "
-        typeflag = b"0"
-        linkname = b"\x00" * 100
-        magic = b"ustar\x00"
-        version = b"00"
-        uname = b"\x00" * 32
-        gname = b"\x00" * 32
-        devmajor = b"\x00" * 8
-        devminor = b"\x00" * 8
-        prefix = b"\x00" * 155
-        pad = b"\x00" * 12
-
-        hdr = name_field
-        hdr += mode_field
-        hdr += uid_field
-        hdr += gid_field
-        hdr += size_field
-        hdr += mtime_field
-        hdr += chksum_field
-        hdr += typeflag
-        hdr += linkname
-        hdr += magic
-        hdr += version
-        hdr += uname
-        hdr += gname
-        hdr += devmajor
-        hdr += devminor
-        hdr += prefix
-        hdr += pad
+        name_field = name_b + _NUL100[len(name_b) :]
+        size_field = (_oct(size)[-11:].zfill(11) + "\x00").encode()
+        hdr = _join_bytes((name_field, _MODE_UID_GID, size_field, _HDR_TAIL))
         chk = _sum_bytes(hdr)
-        chk_o = _oct(chk)
-        if len(chk_o) > 6:
-            chk_o = chk_o[-6:]
-        chk_s = (("0" * (6 - len(chk_o))) + chk_o + "\x00 ").encode()
+        chk_s = (_oct(chk)[-6:].zfill(6) + "\x00 ").encode()
         hdr = hdr[:148] + chk_s + hdr[156:]
         return hdr
 
+    _PAD512 = b"\x00" * 512
+    _END = b"\x00" * 1024
+
     def _make_tar(files):
-        out = b""
+        # Collect the pieces and join once; pocketpy-ucharm's bytearray has no
+        # extend(), so this goes through _join_bytes rather than a bytearray
+        parts = []
         for name, content in files:
-            out += _ustar_header(name, len(content)) + content
+            parts.append(_ustar_header(name, len(content)))
+            parts.append(content)
             pad = (512 - (len(content) % 512)) % 512
             if pad:
-                out += b"\x00" * pad
-        out += b"\x00" * 1024
-        return out
-
-    TAR_BYTES = _make_tar([("a.txt", b"hi"), ("empty.txt", b"")])
-    path = "__ucharm_test.tar"
-    try:
-        with open(path, "wb") as f:
-            f.write(TAR_BYTES)
-        test("is_tarfile True", tarfile_mod.is_tarfile(path) is True)
-        tf = tarfile_mod.open(path, "r")
-        names = tf.getnames()
-        test("getnames returns list", isinstance(names, list))
-        test("contains a.txt", "a.txt" in names)
-        fobj = tf.extractfile("a.txt")
-        data = fobj.read()
-        test("extractfile/read bytes", data == b"hi")
-        empty = tf.extractfile("empty.txt").read()
-        test("extract empty", empty == b"")
-        tf.close()
+                parts.append(_PAD512[:pad])
+        parts.append(_END)
+        return _join_bytes(parts)
+
+    # Only build and write the archive when there is an API to read it back
+    if has_open and has_is_tarfile:
+        TAR_BYTES = _make_tar([("a.txt", b"hi"), ("empty.txt", b"")])
+        path = "__ucharm_test.tar"
         try:
-            import os
-
-            os.remove(path)
-        except Exception:
-            pass
-    except Exception as e:
-        test("tarfile read", False)
-        print(f"  ERROR: {e}")
-
-print("\n" + "=" * 50)
-print(f"Results: {_passed} passed, {_failed} failed, {_skipped} skipped")
-if _errors:
-    print("Failed tests:")
-    for e in _errors:
-        print(f"  - {e}")
-    sys.exit(1)
-else:
-    print("All tests passed!")
+            with open(path, "wb") as f:
+                f.write(TAR_BYTES)
+            test("is_tarfile True", tarfile_mod.is_tarfile(path) is True)
+            tf = tarfile_mod.open(path, "r")
+            names = tf.getnames()
+            test("getnames returns list", isinstance(names, list))
+            test("contains a.txt", "a.txt" in names)
+            fobj = tf.extractfile("a.txt")
+            data = fobj.read()
+            test("extractfile/read bytes", data == b"hi")
+            empty = tf.extractfile("empty.txt").read()
+            test("extract empty", empty == b"")
+            tf.close()
+            try:
+                import os
+
+                os.remove(path)
+            except Exception:
+                pass
+        except Exception as e:
+            test("tarfile read", False)
+            note("  ERROR: " + str(e))
+    else:
+        skip_many(
+            (
+                "is_tarfile True",
+                "getnames returns list",
+                "contains a.txt",
+                "extractfile/read bytes",
+                "extract empty",
+            ),
+            "tarfile.open/is_tarfile not available",
+        )
+
+sys.exit(summary())
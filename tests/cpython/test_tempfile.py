@@ -9,55 +9,55 @@ import os
 import sys
 import tempfile
 
-# Test tracking
-_passed = 0
-_failed = 0
-_skipped = 0
-_errors = []
-_cleanup_files = []
-_cleanup_dirs = []
+try:
+    from _harness import section, skip_many, summary, test
+except ImportError:
+    print("ERROR: _harness not importable; run from tests/cpython")
+    sys.exit(1)
 
+# Attribute names probed once
+_tempfile_attrs = set(dir(tempfile))
 
-def test(name, condition):
-    global _passed, _failed, _errors
-    if condition:
-        _passed += 1
-        print(f"  PASS: {name}")
-    else:
-        _failed += 1
-        _errors.append(name)
-        print(f"  FAIL: {name}")
 
+# mkdtemp tests, skipped together when mkdtemp is missing or raises
+_MKDTEMP_NAMES = (
+    "mkdtemp returns string",
+    "mkdtemp dir exists",
+    "mkdtemp is dir",
+)
 
-def skip(name, reason):
-    global _skipped
-    _skipped += 1
-    print(f"  SKIP: {name} ({reason})")
+# Paths removed by do_cleanup()
+_cleanup_files = []
+_cleanup_dirs = []
 
 
-# MicroPython-compatible path functions
-def path_exists(path):
-    try:
-        os.stat(path)
-        return True
-    except OSError:
-        return False
+# File type bits of st_mode
+_S_IFMT = 0o170000
+_S_IFDIR = 0o040000
+_S_IFREG = 0o100000
 
 
-def path_isdir(path):
+# st_mode of path, or None if it cannot be stat'ed. The mkstemp/mkdtemp
+# checks take "exists" and the file type from this one stat call.
+def _stat_mode(path):
     try:
-        mode = os.stat(path)[0]
-        return (mode & 0o170000) == 0o040000  # S_IFDIR
+        return os.stat(path)[0]
     except OSError:
-        return False
+        return None
 
 
-def path_isfile(path):
-    try:
-        mode = os.stat(path)[0]
-        return (mode & 0o170000) == 0o100000  # S_IFREG
-    except OSError:
-        return False
+# The os.path predicates where available, otherwise the same stat helper
+if hasattr(os, "path"):
+    path_exists = os.path.exists
+    path_isdir = os.path.isdir
+else:
+
+    def path_exists(path):
+        return _stat_mode(path) is not None
+
+    def path_isdir(path):
+        mode = _stat_mode(path)
+        return mode is not None and (mode & _S_IFMT) == _S_IFDIR
 
 
 def cleanup_file(path):
@@ -69,6 +69,8 @@ def cleanup_dir(path):
 
 
 def do_cleanup():
+    if not _cleanup_files and not _cleanup_dirs:
+        return
     for f in _cleanup_files:
         try:
             os.remove(f)
@@ -85,43 +87,53 @@ def do_cleanup():
 # tempfile.gettempdir() tests
 # ============================================================================
 
-print("\n=== tempfile.gettempdir() tests ===")
+section("tempfile.gettempdir() tests")
 
-if hasattr(tempfile, "gettempdir"):
+if "gettempdir" in _tempfile_attrs:
     tmpdir = tempfile.gettempdir()
     test("gettempdir returns string", isinstance(tmpdir, str))
     test("gettempdir not empty", len(tmpdir) > 0)
     test("gettempdir exists", path_isdir(tmpdir))
 else:
-    skip("gettempdir returns string", "gettempdir not available")
-    skip("gettempdir not empty", "gettempdir not available")
-    skip("gettempdir exists", "gettempdir not available")
+    skip_many(
+        (
+            "gettempdir returns string",
+            "gettempdir not empty",
+            "gettempdir exists",
+        ),
+        "gettempdir not available",
+    )
 
 
 # ============================================================================
 # tempfile.mktemp() tests
 # ============================================================================
 
-print("\n=== tempfile.mktemp() tests ===")
+section("tempfile.mktemp() tests")
 
-if hasattr(tempfile, "mktemp"):
+if "mktemp" in _tempfile_attrs:
     path = tempfile.mktemp()
     test("mktemp returns string", isinstance(path, str))
     test("mktemp not empty", len(path) > 0)
     test("mktemp file not created", not path_exists(path))
 else:
-    skip("mktemp returns string", "mktemp not available")
-    skip("mktemp not empty", "mktemp not available")
-    skip("mktemp file not created", "mktemp not available")
+    skip_many(
+        (
+            "mktemp returns string",
+            "mktemp not empty",
+            "mktemp file not created",
+        ),
+        "mktemp not available",
+    )
 
 
 # ============================================================================
 # tempfile.mkstemp() tests
 # ============================================================================
 
-print("\n=== tempfile.mkstemp() tests ===")
+section("tempfile.mkstemp() tests")
 
-if hasattr(tempfile, "mkstemp"):
+if "mkstemp" in _tempfile_attrs:
     result = tempfile.mkstemp()
     if isinstance(result, tuple):
         fd, path = result
@@ -129,38 +141,45 @@ if hasattr(tempfile, "mkstemp"):
     else:
         path = result
     test("mkstemp returns path", isinstance(path, str))
-    test("mkstemp file exists", path_exists(path))
-    test("mkstemp is file", path_isfile(path))
+    mode = _stat_mode(path)
+    test("mkstemp file exists", mode is not None)
+    test("mkstemp is file", mode is not None and (mode & _S_IFMT) == _S_IFREG)
     cleanup_file(path)
 else:
-    skip("mkstemp returns path", "mkstemp not available")
-    skip("mkstemp file exists", "mkstemp not available")
-    skip("mkstemp is file", "mkstemp not available")
+    skip_many(
+        (
+            "mkstemp returns path",
+            "mkstemp file exists",
+            "mkstemp is file",
+        ),
+        "mkstemp not available",
+    )
 
 
 # ============================================================================
 # tempfile.mkdtemp() tests
 # ============================================================================
 
-print("\n=== tempfile.mkdtemp() tests ===")
+section("tempfile.mkdtemp() tests")
 
-if hasattr(tempfile, "mkdtemp"):
+if "mkdtemp" in _tempfile_attrs:
     try:
-        # pocketpy-ucharm mkdtemp requires an absolute path prefix
-        # since it doesn't have a default temp directory
-        dpath = tempfile.mkdtemp("/tmp/ucharm_test_")
+        if sys.implementation.name == "pocketpy":
+            # pocketpy-ucharm mkdtemp requires an absolute path prefix
+            # since it doesn't have a default temp directory
+            dpath = tempfile.mkdtemp("/tmp/ucharm_test_")
+        else:
+            # CPython's first positional argument is the suffix
+            dpath = tempfile.mkdtemp(prefix="ucharm_test_")
         test("mkdtemp returns string", isinstance(dpath, str))
-        test("mkdtemp dir exists", path_exists(dpath))
-        test("mkdtemp is dir", path_isdir(dpath))
+        mode = _stat_mode(dpath)
+        test("mkdtemp dir exists", mode is not None)
+        test("mkdtemp is dir", mode is not None and (mode & _S_IFMT) == _S_IFDIR)
         cleanup_dir(dpath)
     except Exception as e:
-        skip("mkdtemp returns string", f"mkdtemp raised: {e}")
-        skip("mkdtemp dir exists", f"mkdtemp raised: {e}")
-        skip("mkdtemp is dir", f"mkdtemp raised: {e}")
+        skip_many(_MKDTEMP_NAMES, f"mkdtemp raised: {e}")
 else:
-    skip("mkdtemp returns string", "mkdtemp not available")
-    skip("mkdtemp dir exists", "mkdtemp not available")
-    skip("mkdtemp is dir", "mkdtemp not available")
+    skip_many(_MKDTEMP_NAMES, "mkdtemp not available")
 
 
 # ============================================================================
@@ -174,10 +193,4 @@ do_cleanup()
 # Summary
 # ============================================================================
 
-print("\n" + "=" * 50)
-print(f"Results: {_passed} passed, {_failed} failed, {_skipped} skipped")
-if _errors:
-    print("Failed tests:")
-    for e in _errors:
-        print(f"  - {e}")
-    sys.exit(1)
+sys.exit(summary())
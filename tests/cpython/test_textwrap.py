@@ -5,56 +5,40 @@ Works on both CPython and pocketpy-ucharm.
 Based on CPython's Lib/test/test_textwrap.py
 """
 
+import sys
 import textwrap
 
-# Test tracking
-_passed = 0
-_failed = 0
-_errors = []
-_skipped = 0
-
-
-def test(name, condition):
-    global _passed, _failed, _errors
-    if condition:
-        _passed += 1
-        print(f"  PASS: {name}")
-    else:
-        _failed += 1
-        _errors.append(name)
-        print(f"  FAIL: {name}")
-
+try:
+    from _harness import section, skip, summary, test
+except ImportError:
+    print("ERROR: _harness not importable; run from tests/cpython")
+    sys.exit(1)
 
-def skip(name, reason):
-    global _skipped
-    _skipped += 1
-    print(f"  SKIP: {name} ({reason})")
+# Attribute names probed once; each section is gated on its function
+_textwrap_attrs = set(dir(textwrap))
 
 
 # ============================================================================
 # textwrap.wrap() tests
 # ============================================================================
 
-print("\n=== textwrap.wrap() tests ===")
+section("textwrap.wrap() tests")
 
-if hasattr(textwrap, "wrap"):
+if "wrap" in _textwrap_attrs:
     # Basic wrap - use positional args only for ucharm compatibility
     text = "Hello World, this is a test of text wrapping functionality."
     result = textwrap.wrap(text, 20)
     test("wrap basic", len(result) > 1)
-    test("wrap line length", all([len(line) <= 20 for line in result]))
+    test("wrap line length", not result or max(map(len, result)) <= 20)
 
-    # Short text that doesn't need wrapping
-    result = textwrap.wrap("Hello", 20)
-    test("wrap short", result == ["Hello"])
-
-    # Empty string
-    result = textwrap.wrap("", 20)
-    test("wrap empty", result == [])
-
-    # Exact width
-    result = textwrap.wrap("Hello World", 11)
-    test("wrap exact", result == ["Hello World"])
+    # (name, text, width, expected): short text, empty string, exact width
+    _WRAP_CASES = (
+        ("wrap short", "Hello", 20, ["Hello"]),
+        ("wrap empty", "", 20, []),
+        ("wrap exact", "Hello World", 11, ["Hello World"]),
+    )
+    for name, text, width, expected in _WRAP_CASES:
+        test(name, textwrap.wrap(text, width) == expected)
 else:
     skip("wrap basic", "textwrap.wrap not available")
     skip("wrap line length", "textwrap.wrap not available")
@@ -67,9 +51,9 @@ else:
 # textwrap.fill() tests
 # ============================================================================
 
-print("\n=== textwrap.fill() tests ===")
+section("textwrap.fill() tests")
 
-if hasattr(textwrap, "fill"):
+if "fill" in _textwrap_attrs:
     text = "Hello World, this is a test."
     result = textwrap.fill(text, 15)
     test("fill returns string", isinstance(result, str))
@@ -88,19 +72,20 @@ else:
 # textwrap.dedent() tests
 # ============================================================================
 
-print("\n=== textwrap.dedent() tests ===")
+section("textwrap.dedent() tests")
 
-if hasattr(textwrap, "dedent"):
+if "dedent" in _textwrap_attrs:
     # Basic dedent
     text = "    Hello\n    World\n    Test"
     result = textwrap.dedent(text)
-    expected = "Hello\nWorld\nTest"
-    test("dedent basic", result == expected)
+    test("dedent basic", result == "Hello\nWorld\nTest")
 
-    # Mixed indentation (uses common prefix)
-    text = "        Line 1\n        Line 2\n        Line 3"
+    # Mixed indentation (uses common prefix); the check looks for the same
+    # prefix the input was built with
+    _IND8 = " " * 8
+    text = _IND8 + "Line 1\n" + _IND8 + "Line 2\n" + _IND8 + "Line 3"
     result = textwrap.dedent(text)
-    test("dedent common prefix", not result.startswith("        "))
+    test("dedent common prefix", not result.startswith(_IND8))
 
     # No indentation
     text = "No indent\nAnother line"
@@ -122,27 +107,18 @@ else:
 # textwrap.indent() tests
 # ============================================================================
 
-print("\n=== textwrap.indent() tests ===")
-
-if hasattr(textwrap, "indent"):
-    # Basic indent
-    text = "Hello\nWorld\nTest"
-    result = textwrap.indent(text, "  ")
-    expected = "  Hello\n  World\n  Test"
-    test("indent basic", result == expected)
+section("textwrap.indent() tests")
 
-    # Different prefix
-    text = "Line 1\nLine 2"
-    result = textwrap.indent(text, ">>> ")
-    test("indent prefix", result == ">>> Line 1\n>>> Line 2")
-
-    # Empty string
-    result = textwrap.indent("", "  ")
-    test("indent empty", result == "")
-
-    # Single line
-    result = textwrap.indent("Hello", "  ")
-    test("indent single", result == "  Hello")
+if "indent" in _textwrap_attrs:
+    # (name, text, prefix, expected)
+    _INDENT_CASES = (
+        ("indent basic", "Hello\nWorld\nTest", "  ", "  Hello\n  World\n  Test"),
+        ("indent prefix", "Line 1\nLine 2", ">>> ", ">>> Line 1\n>>> Line 2"),
+        ("indent empty", "", "  ", ""),
+        ("indent single", "Hello", "  ", "  Hello"),
+    )
+    for name, text, prefix, expected in _INDENT_CASES:
+        test(name, textwrap.indent(text, prefix) == expected)
 else:
     skip("indent basic", "textwrap.indent not available")
     skip("indent prefix", "textwrap.indent not available")
@@ -154,17 +130,15 @@ else:
 # textwrap.shorten() tests
 # ============================================================================
 
-print("\n=== textwrap.shorten() tests ===")
+section("textwrap.shorten() tests")
 
-if hasattr(textwrap, "shorten"):
+if "shorten" in _textwrap_attrs:
     # Basic shorten - use positional args
     text = "Hello World, this is a long piece of text that needs to be shortened."
     result = textwrap.shorten(text, 30)
     test("shorten fits width", len(result) <= 30)
-    test(
-        "shorten has placeholder",
-        "[...]" in result or "..." in result or len(result) <= 30,
-    )
+    # "..." also matches the default "[...]" placeholder
+    test("shorten has placeholder", "..." in result or len(result) <= 30)
 
     # Short text that doesn't need shortening
     result = textwrap.shorten("Hello", 20)
@@ -179,9 +153,9 @@ else:
 # Combined tests
 # ============================================================================
 
-print("\n=== Combined tests ===")
+section("Combined tests")
 
-if hasattr(textwrap, "dedent") and hasattr(textwrap, "wrap"):
+if "dedent" in _textwrap_attrs and "wrap" in _textwrap_attrs:
     # Dedent then wrap
     text = "    This is a long line of indented text that should be dedented and then wrapped to a specific width."
     dedented = textwrap.dedent(text)
@@ -190,7 +164,7 @@ if hasattr(textwrap, "dedent") and hasattr(textwrap, "wrap"):
 else:
     skip("dedent + wrap", "textwrap.dedent or textwrap.wrap not available")
 
-if hasattr(textwrap, "indent"):
+if "indent" in _textwrap_attrs:
     # Indent then fill
     text = "Hello World"
     indented = textwrap.indent(text, ">>> ")
@@ -203,9 +177,9 @@ else:
 # Edge cases
 # ============================================================================
 
-print("\n=== Edge cases ===")
+section("Edge cases")
 
-if hasattr(textwrap, "wrap"):
+if "wrap" in _textwrap_attrs:
     # Very long word
     result = textwrap.wrap("Supercalifragilisticexpialidocious", 10)
     test("wrap long word", len(result) >= 1)
@@ -228,14 +202,4 @@ else:
 # Summary
 # ============================================================================
 
-print("\n" + "=" * 50)
-print(f"Results: {_passed} passed, {_failed} failed, {_skipped} skipped")
-if _errors:
-    print("Failed tests:")
-    for e in _errors:
-        print(f"  - {e}")
-    import sys
-
-    sys.exit(1)
-else:
-    print("All tests passed!")
+sys.exit(summary())
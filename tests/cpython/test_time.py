@@ -8,28 +8,14 @@ Based on CPython's Lib/test/test_time.py
 import sys
 import time
 
-# Test tracking
-_passed = 0
-_failed = 0
-_errors = []
-_skipped = 0
-
-
-def test(name, condition):
-    global _passed, _failed, _errors
-    if condition:
-        _passed += 1
-        print(f"  PASS: {name}")
-    else:
-        _failed += 1
-        _errors.append(name)
-        print(f"  FAIL: {name}")
-
+try:
+    from _harness import section, skip, summary, test
+except ImportError:
+    print("ERROR: _harness not importable; run from tests/cpython")
+    sys.exit(1)
 
-def skip(name, reason):
-    global _skipped
-    _skipped += 1
-    print(f"  SKIP: {name} ({reason})")
+# Attribute names probed once; each section is gated on its function
+_time_attrs = set(dir(time))
 
 
 # Helper to get struct_time field (works with both tuple and named attributes)
@@ -40,11 +26,16 @@ def get_tm_field(st, index, attr):
     return st[index]
 
 
+def is_struct_time(st):
+    """True for a plain time tuple or a struct_time instance."""
+    return isinstance(st, tuple) or type(st).__name__ == "struct_time"
+
+
 # ============================================================================
 # time.time() tests
 # ============================================================================
 
-print("\n=== time.time() tests ===")
+section("time.time() tests")
 
 t = time.time()
 test("time returns number", isinstance(t, (int, float)))
@@ -61,7 +52,7 @@ test("time increases", t2 >= t1)
 # time.sleep() tests
 # ============================================================================
 
-print("\n=== time.sleep() tests ===")
+section("time.sleep() tests")
 
 # Sleep for a short time
 start = time.time()
@@ -80,14 +71,15 @@ test("sleep 0", elapsed < 0.1)
 # time.localtime() tests
 # ============================================================================
 
-print("\n=== time.localtime() tests ===")
+section("time.localtime() tests")
 
-if hasattr(time, "localtime"):
+if "localtime" in _time_attrs:
+    # One reading shared with the mktime roundtrip and strftime tests; the
+    # no-argument localtime() stays within the roundtrip tolerance of now
+    now = time.time()
     lt = time.localtime()
-    test(
-        "localtime returns struct_time",
-        isinstance(lt, (tuple, type(lt))),
-    )
+    # CPython's struct_time is a tuple subclass; pocketpy-ucharm's is not
+    test("localtime returns struct_time", is_struct_time(lt))
 
     # Check reasonable values using attribute access
     tm_year = get_tm_field(lt, 0, "tm_year")
@@ -122,11 +114,11 @@ else:
 # time.gmtime() tests
 # ============================================================================
 
-print("\n=== time.gmtime() tests ===")
+section("time.gmtime() tests")
 
-if hasattr(time, "gmtime"):
+if "gmtime" in _time_attrs:
     gt = time.gmtime()
-    test("gmtime returns struct_time", isinstance(gt, (tuple, type(gt))))
+    test("gmtime returns struct_time", is_struct_time(gt))
 
     # Check reasonable values using attribute access
     tm_year = get_tm_field(gt, 0, "tm_year")
@@ -152,14 +144,15 @@ else:
 # time.mktime() tests
 # ============================================================================
 
-print("\n=== time.mktime() tests ===")
+section("time.mktime() tests")
 
-if hasattr(time, "mktime"):
-    # Round-trip test
-    now = time.time()
-    lt = time.localtime(now)
-    back = time.mktime(lt)
-    test("mktime roundtrip", abs(now - back) < 2)  # Allow 1 second tolerance
+if "mktime" in _time_attrs:
+    # Round-trip test against the localtime() reading taken above
+    if "localtime" in _time_attrs:
+        back = time.mktime(lt)
+        test("mktime roundtrip", abs(now - back) < 2)  # Allow 1 second tolerance
+    else:
+        skip("mktime roundtrip", "time.localtime not available")
 
     # Known date
     # 2020-01-01 00:00:00
@@ -179,11 +172,10 @@ else:
 # time.strftime() tests
 # ============================================================================
 
-print("\n=== time.strftime() tests ===")
-
-if hasattr(time, "strftime") and hasattr(time, "localtime"):
-    lt = time.localtime()
+section("time.strftime() tests")
 
+if "strftime" in _time_attrs and "localtime" in _time_attrs:
+    # Formats the localtime() reading taken above
     # Basic format
     result = time.strftime("%Y", lt)
     test("strftime %Y", len(result) == 4 and result.isdigit())
@@ -211,9 +203,9 @@ else:
 # time.strptime() tests
 # ============================================================================
 
-print("\n=== time.strptime() tests ===")
+section("time.strptime() tests")
 
-if hasattr(time, "strptime"):
+if "strptime" in _time_attrs:
     # Parse date
     result = time.strptime("2020-01-15", "%Y-%m-%d")
     r_year = get_tm_field(result, 0, "tm_year")
@@ -235,18 +227,23 @@ else:
 # time.monotonic() tests
 # ============================================================================
 
-print("\n=== time.monotonic() tests ===")
+section("time.monotonic() tests")
 
-if hasattr(time, "monotonic"):
+# Both clocks should increase; one 10ms sleep brackets the monotonic and
+# perf_counter "increases" checks
+has_monotonic = "monotonic" in _time_attrs
+has_perf_counter = "perf_counter" in _time_attrs
+if has_monotonic:
+    m1 = time.monotonic()
+if has_perf_counter:
+    p1 = time.perf_counter()
+time.sleep(0.01)
+
+if has_monotonic:
     m = time.monotonic()
     test("monotonic returns number", isinstance(m, (int, float)))
     test("monotonic is non-negative", m >= 0)
-
-    # Should always increase
-    m1 = time.monotonic()
-    time.sleep(0.01)
-    m2 = time.monotonic()
-    test("monotonic increases", m2 > m1)
+    test("monotonic increases", m > m1)
 else:
     skip("monotonic tests", "time.monotonic not available")
 
@@ -255,17 +252,12 @@ else:
 # time.perf_counter() tests
 # ============================================================================
 
-print("\n=== time.perf_counter() tests ===")
+section("time.perf_counter() tests")
 
-if hasattr(time, "perf_counter"):
+if has_perf_counter:
     p = time.perf_counter()
     test("perf_counter returns number", isinstance(p, (int, float)))
-
-    # Should increase
-    p1 = time.perf_counter()
-    time.sleep(0.01)
-    p2 = time.perf_counter()
-    test("perf_counter increases", p2 > p1)
+    test("perf_counter increases", p > p1)
 else:
     skip("perf_counter tests", "time.perf_counter not available")
 
@@ -274,9 +266,9 @@ else:
 # time.time_ns() tests
 # ============================================================================
 
-print("\n=== time.time_ns() tests ===")
+section("time.time_ns() tests")
 
-if hasattr(time, "time_ns"):
+if "time_ns" in _time_attrs:
     t = time.time_ns()
     test("time_ns returns int", isinstance(t, int))
     test("time_ns is positive", t > 0)
@@ -289,7 +281,7 @@ else:
 # Edge cases
 # ============================================================================
 
-print("\n=== Edge cases ===")
+section("Edge cases")
 
 # Very small sleep
 start = time.time()
@@ -297,14 +289,16 @@ time.sleep(0.001)
 elapsed = time.time() - start
 test("sleep 1ms", elapsed >= 0.0005)
 
-# Multiple time() calls
-times = [time.time() for _ in range(10)]
-# Check that times are monotonically non-decreasing
+# Multiple time() calls should be monotonically non-decreasing; only the
+# previous sample is kept
+prev = time.time()
 times_increasing = True
-for i in range(9):
-    if times[i] > times[i + 1]:
+for _ in range(9):
+    cur = time.time()
+    if cur < prev:
         times_increasing = False
         break
+    prev = cur
 test("multiple time calls", times_increasing)
 
 
@@ -312,12 +306,4 @@ test("multiple time calls", times_increasing)
 # Summary
 # ============================================================================
 
-print("\n" + "=" * 50)
-print(f"Results: {_passed} passed, {_failed} failed, {_skipped} skipped")
-if _errors:
-    print("Failed tests:")
-    for e in _errors:
-        print(f"  - {e}")
-    sys.exit(1)
-else:
-    print("All tests passed!")
+sys.exit(summary())
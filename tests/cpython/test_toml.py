@@ -5,28 +5,11 @@ Works on both CPython and pocketpy-ucharm.
 
 import sys
 
-_passed = 0
-_failed = 0
-_errors = []
-_skipped = 0
-
-
-def test(name, condition):
-    global _passed, _failed, _errors
-    if condition:
-        _passed += 1
-        print(f"  PASS: {name}")
-    else:
-        _failed += 1
-        _errors.append(name)
-        print(f"  FAIL: {name}")
-
-
-def skip(name, reason):
-    global _skipped
-    _skipped += 1
-    print(f"  SKIP: {name} ({reason})")
-
+try:
+    from _harness import note, section, skip, summary, test
+except ImportError:
+    print("ERROR: _harness not importable; run from tests/cpython")
+    sys.exit(1)
 
 try:
     import toml
@@ -37,7 +20,7 @@ except Exception:
     skip("toml import", "module not available (not stdlib on CPython)")
 
 if HAS_TOML:
-    print("\n=== toml.loads/dumps/load ===")
+    section("toml.loads/dumps/load")
     test("has loads", hasattr(toml, "loads") and callable(toml.loads))
     test("has dumps", hasattr(toml, "dumps") and callable(toml.dumps))
     test("has load", hasattr(toml, "load") and callable(toml.load))
@@ -66,14 +49,6 @@ if HAS_TOML:
             pass
     except Exception as e:
         test("toml operations", False)
-        print(f"  ERROR: {e}")
+        note(f"  ERROR: {e}")
 
-print("\n" + "=" * 50)
-print(f"Results: {_passed} passed, {_failed} failed, {_skipped} skipped")
-if _errors:
-    print("Failed tests:")
-    for e in _errors:
-        print(f"  - {e}")
-    sys.exit(1)
-else:
-    print("All tests passed!")
+sys.exit(summary())
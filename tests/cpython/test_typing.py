@@ -8,78 +8,54 @@ Based on CPython's Lib/test/test_typing.py
 """
 
 import sys
-import typing
-
-# Test tracking
-_passed = 0
-_failed = 0
-_skipped = 0
-_errors = []
-
-
-def test(name, condition):
-    global _passed, _failed, _errors
-    if condition:
-        _passed += 1
-        print(f"  PASS: {name}")
-    else:
-        _failed += 1
-        _errors.append(name)
-        print(f"  FAIL: {name}")
 
+try:
+    from _harness import section, summary, test
+except ImportError:
+    print("ERROR: _harness not importable; run from tests/cpython")
+    sys.exit(1)
 
-def skip(name, reason):
-    global _skipped
-    _skipped += 1
-    print(f"  SKIP: {name} ({reason})")
+try:
+    import typing
+except ImportError:
+    print("SKIP: typing module not available")
+    sys.exit(0)
 
+# Attribute names probed once
+_typing_attrs = set(dir(typing))
 
 # ============================================================================
 # Basic type aliases exist
 # ============================================================================
 
-print("\n=== Basic type aliases ===")
+section("Basic type aliases")
 
-test("Any exists", hasattr(typing, "Any"))
-test("Optional exists", hasattr(typing, "Optional"))
-test("Union exists", hasattr(typing, "Union"))
-test("List exists", hasattr(typing, "List"))
-test("Dict exists", hasattr(typing, "Dict"))
-test("Set exists", hasattr(typing, "Set"))
-test("Tuple exists", hasattr(typing, "Tuple"))
-test("Callable exists", hasattr(typing, "Callable"))
+for name in ("Any", "Optional", "Union", "List", "Dict", "Set", "Tuple", "Callable"):
+    test(name + " exists", name in _typing_attrs)
 
 # ============================================================================
 # Generic types exist
 # ============================================================================
 
-print("\n=== Generic types ===")
+section("Generic types")
 
-test("Generic exists", hasattr(typing, "Generic"))
-test("TypeVar exists", hasattr(typing, "TypeVar"))
-test("Sequence exists", hasattr(typing, "Sequence"))
-test("Mapping exists", hasattr(typing, "Mapping"))
-test("Iterable exists", hasattr(typing, "Iterable"))
-test("Iterator exists", hasattr(typing, "Iterator"))
+for name in ("Generic", "TypeVar", "Sequence", "Mapping", "Iterable", "Iterator"):
+    test(name + " exists", name in _typing_attrs)
 
 # ============================================================================
 # Special forms exist
 # ============================================================================
 
-print("\n=== Special forms ===")
+section("Special forms")
 
-test("ClassVar exists", hasattr(typing, "ClassVar"))
-test("Final exists", hasattr(typing, "Final"))
-test("Literal exists", hasattr(typing, "Literal"))
-test("Annotated exists", hasattr(typing, "Annotated"))
-test("NoReturn exists", hasattr(typing, "NoReturn"))
-test("Never exists", hasattr(typing, "Never"))
+for name in ("ClassVar", "Final", "Literal", "Annotated", "NoReturn", "Never"):
+    test(name + " exists", name in _typing_attrs)
 
 # ============================================================================
 # TypeVar basic usage
 # ============================================================================
 
-print("\n=== TypeVar usage ===")
+section("TypeVar usage")
 
 # Creating TypeVars should work
 try:
@@ -92,52 +68,52 @@ except Exception as e:
 # Optional and Union
 # ============================================================================
 
-print("\n=== Optional and Union ===")
+section("Optional and Union")
 
-test("Optional in typing", "Optional" in dir(typing))
-test("Union in typing", "Union" in dir(typing))
+test("Optional in typing", "Optional" in _typing_attrs)
+test("Union in typing", "Union" in _typing_attrs)
 
 # ============================================================================
 # Protocol and runtime_checkable
 # ============================================================================
 
-print("\n=== Protocol ===")
+section("Protocol")
 
-test("Protocol exists", hasattr(typing, "Protocol"))
-test("runtime_checkable exists", hasattr(typing, "runtime_checkable"))
+for name in ("Protocol", "runtime_checkable"):
+    test(name + " exists", name in _typing_attrs)
 
 # ============================================================================
 # Async types
 # ============================================================================
 
-print("\n=== Async types ===")
+section("Async types")
 
-test("Awaitable exists", hasattr(typing, "Awaitable"))
-test("Coroutine exists", hasattr(typing, "Coroutine"))
-test("AsyncGenerator exists", hasattr(typing, "AsyncGenerator"))
-test("AsyncIterator exists", hasattr(typing, "AsyncIterator"))
-test("AsyncIterable exists", hasattr(typing, "AsyncIterable"))
+for name in (
+    "Awaitable",
+    "Coroutine",
+    "AsyncGenerator",
+    "AsyncIterator",
+    "AsyncIterable",
+):
+    test(name + " exists", name in _typing_attrs)
 
 # ============================================================================
 # IO types
 # ============================================================================
 
-print("\n=== IO types ===")
+section("IO types")
 
-test("IO exists", hasattr(typing, "IO"))
-test("TextIO exists", hasattr(typing, "TextIO"))
-test("BinaryIO exists", hasattr(typing, "BinaryIO"))
+for name in ("IO", "TextIO", "BinaryIO"):
+    test(name + " exists", name in _typing_attrs)
 
 # ============================================================================
 # Utility functions
 # ============================================================================
 
-print("\n=== Utility functions ===")
+section("Utility functions")
 
-test("cast exists", hasattr(typing, "cast"))
-test("overload exists", hasattr(typing, "overload"))
-test("final exists", hasattr(typing, "final"))
-test("no_type_check exists", hasattr(typing, "no_type_check"))
+for name in ("cast", "overload", "final", "no_type_check"):
+    test(name + " exists", name in _typing_attrs)
 
 # Test cast (should work as identity in runtime)
 try:
@@ -150,29 +126,22 @@ except Exception:
 # TYPE_CHECKING constant
 # ============================================================================
 
-print("\n=== TYPE_CHECKING ===")
+section("TYPE_CHECKING")
 
-test("TYPE_CHECKING exists", hasattr(typing, "TYPE_CHECKING"))
+test("TYPE_CHECKING exists", "TYPE_CHECKING" in _typing_attrs)
 test("TYPE_CHECKING is False at runtime", typing.TYPE_CHECKING == False)
 
 # ============================================================================
 # get_args and get_origin
 # ============================================================================
 
-print("\n=== Type introspection ===")
+section("Type introspection")
 
-test("get_args exists", hasattr(typing, "get_args"))
-test("get_origin exists", hasattr(typing, "get_origin"))
-test("get_type_hints exists", hasattr(typing, "get_type_hints"))
+for name in ("get_args", "get_origin", "get_type_hints"):
+    test(name + " exists", name in _typing_attrs)
 
 # ============================================================================
 # Summary
 # ============================================================================
 
-print("\n" + "=" * 50)
-print(f"Results: {_passed} passed, {_failed} failed, {_skipped} skipped")
-if _errors:
-    print("Failed tests:")
-    for e in _errors:
-        print(f"  - {e}")
-    sys.exit(1)
+sys.exit(summary())
@@ -7,29 +7,11 @@ Based on CPython's Lib/test/test_unittest/
 
 import sys
 
-# Test tracking
-_passed = 0
-_failed = 0
-_errors = []
-_skipped = 0
-
-
-def test(name, condition):
-    global _passed, _failed, _errors
-    if condition:
-        _passed += 1
-        print(f"  PASS: {name}")
-    else:
-        _failed += 1
-        _errors.append(name)
-        print(f"  FAIL: {name}")
-
-
-def skip(name, reason):
-    global _skipped
-    _skipped += 1
-    print(f"  SKIP: {name} ({reason})")
-
+try:
+    from _harness import section, summary, test
+except ImportError:
+    print("ERROR: _harness not importable; run from tests/cpython")
+    sys.exit(1)
 
 try:
     import unittest
@@ -42,7 +24,7 @@ except ImportError:
 # Basic TestCase
 # ============================================================================
 
-print("\n=== Basic TestCase ===")
+section("Basic TestCase")
 
 
 class SimpleTestCase(unittest.TestCase):
@@ -68,7 +50,7 @@ test("single test failure", len(result.failures) == 1)
 # Assert methods
 # ============================================================================
 
-print("\n=== Assert methods ===")
+section("Assert methods")
 
 
 class AssertTestCase(unittest.TestCase):
@@ -78,73 +60,43 @@ class AssertTestCase(unittest.TestCase):
 
 tc = AssertTestCase()
 
-# assertTrue/assertFalse
-tc.assertTrue(True)
-test("assertTrue passes", True)
-
-try:
-    tc.assertTrue(False)
-    test("assertTrue fails", False)
-except AssertionError:
-    test("assertTrue fails", True)
-
-tc.assertFalse(False)
-test("assertFalse passes", True)
-
-# assertEqual/assertNotEqual
-tc.assertEqual(1, 1)
-test("assertEqual passes", True)
-
-try:
-    tc.assertEqual(1, 2)
-    test("assertEqual fails", False)
-except AssertionError:
-    test("assertEqual fails", True)
-
-tc.assertNotEqual(1, 2)
-test("assertNotEqual passes", True)
-
-# assertIs/assertIsNot
-a = []
-tc.assertIs(a, a)
-test("assertIs passes", True)
-
-tc.assertIsNot([], [])
-test("assertIsNot passes", True)
-
-# assertIsNone/assertIsNotNone
-tc.assertIsNone(None)
-test("assertIsNone passes", True)
-
-tc.assertIsNotNone(42)
-test("assertIsNotNone passes", True)
-
-# assertIn/assertNotIn
-tc.assertIn(1, [1, 2, 3])
-test("assertIn passes", True)
-
-tc.assertNotIn(4, [1, 2, 3])
-test("assertNotIn passes", True)
-
-# assertIsInstance/assertNotIsInstance
-tc.assertIsInstance([], list)
-test("assertIsInstance passes", True)
-
-tc.assertNotIsInstance([], dict)
-test("assertNotIsInstance passes", True)
-
-# assertGreater/assertLess
-tc.assertGreater(5, 3)
-test("assertGreater passes", True)
-
-tc.assertLess(3, 5)
-test("assertLess passes", True)
-
-tc.assertGreaterEqual(5, 5)
-test("assertGreaterEqual passes", True)
-
-tc.assertLessEqual(5, 5)
-test("assertLessEqual passes", True)
+# (name, method, args): each call should return without raising
+_PASS_CASES = (
+    ("assertTrue passes", "assertTrue", (True,)),
+    ("assertFalse passes", "assertFalse", (False,)),
+    ("assertEqual passes", "assertEqual", (1, 1)),
+    ("assertNotEqual passes", "assertNotEqual", (1, 2)),
+    ("assertIs passes", "assertIs", (tc, tc)),
+    ("assertIsNot passes", "assertIsNot", ([], [])),
+    ("assertIsNone passes", "assertIsNone", (None,)),
+    ("assertIsNotNone passes", "assertIsNotNone", (42,)),
+    ("assertIn passes", "assertIn", (1, [1, 2, 3])),
+    ("assertNotIn passes", "assertNotIn", (4, [1, 2, 3])),
+    ("assertIsInstance passes", "assertIsInstance", ([], list)),
+    ("assertNotIsInstance passes", "assertNotIsInstance", ([], dict)),
+    ("assertGreater passes", "assertGreater", (5, 3)),
+    ("assertLess passes", "assertLess", (3, 5)),
+    ("assertGreaterEqual passes", "assertGreaterEqual", (5, 5)),
+    ("assertLessEqual passes", "assertLessEqual", (5, 5)),
+)
+for name, method, args in _PASS_CASES:
+    try:
+        getattr(tc, method)(*args)
+        test(name, True)
+    except AssertionError:
+        test(name, False)
+
+# (name, method, args): each call should raise AssertionError
+_FAIL_CASES = (
+    ("assertTrue fails", "assertTrue", (False,)),
+    ("assertEqual fails", "assertEqual", (1, 2)),
+)
+for name, method, args in _FAIL_CASES:
+    try:
+        getattr(tc, method)(*args)
+        test(name, False)
+    except AssertionError:
+        test(name, True)
 
 # assertAlmostEqual
 tc.assertAlmostEqual(1.0000001, 1.0000002, places=5)
@@ -155,7 +107,7 @@ test("assertAlmostEqual passes", True)
 # assertRaises
 # ============================================================================
 
-print("\n=== assertRaises ===")
+section("assertRaises")
 
 
 class RaisesTestCase(unittest.TestCase):
@@ -194,7 +146,7 @@ except AssertionError:
 # setUp and tearDown
 # ============================================================================
 
-print("\n=== setUp and tearDown ===")
+section("setUp and tearDown")
 
 setup_called = False
 teardown_called = False
@@ -223,7 +175,7 @@ test("tearDown called", teardown_called)
 # TestSuite
 # ============================================================================
 
-print("\n=== TestSuite ===")
+section("TestSuite")
 
 
 class SuiteTestCase1(unittest.TestCase):
@@ -250,7 +202,7 @@ test("suite all pass", result.wasSuccessful())
 # TestLoader
 # ============================================================================
 
-print("\n=== TestLoader ===")
+section("TestLoader")
 
 
 class LoaderTestCase(unittest.TestCase):
@@ -273,7 +225,7 @@ test("loader finds test methods", suite.countTestCases() == 2)
 # Skip decorators
 # ============================================================================
 
-print("\n=== Skip decorators ===")
+section("Skip decorators")
 
 
 class SkipTestCase(unittest.TestCase):
@@ -293,17 +245,15 @@ class SkipTestCase(unittest.TestCase):
         pass
 
 
-tc = SkipTestCase("test_skipped")
-result = tc.run()
-test("skip decorator works", len(result.skipped) == 1)
-
-tc = SkipTestCase("test_skip_if")
-result = tc.run()
-test("skipIf decorator works", len(result.skipped) == 1)
-
-tc = SkipTestCase("test_skip_unless")
-result = tc.run()
-test("skipUnless decorator works", len(result.skipped) == 1)
+# (name, method): each decorated method should be reported as skipped
+_SKIP_CASES = (
+    ("skip decorator works", "test_skipped"),
+    ("skipIf decorator works", "test_skip_if"),
+    ("skipUnless decorator works", "test_skip_unless"),
+)
+for name, method in _SKIP_CASES:
+    result = SkipTestCase(method).run()
+    test(name, len(result.skipped) == 1)
 
 tc = SkipTestCase("test_not_skipped")
 result = tc.run()
@@ -314,7 +264,7 @@ test("non-skipped test runs", result.wasSuccessful())
 # skipTest method
 # ============================================================================
 
-print("\n=== skipTest method ===")
+section("skipTest method")
 
 
 class SkipTestMethodCase(unittest.TestCase):
@@ -332,7 +282,7 @@ test("skipTest method works", len(result.skipped) == 1)
 # expectedFailure
 # ============================================================================
 
-print("\n=== expectedFailure ===")
+section("expectedFailure")
 
 
 class ExpectedFailureCase(unittest.TestCase):
@@ -358,7 +308,7 @@ test("unexpected success detected", len(result.unexpectedSuccesses) == 1)
 # TestResult
 # ============================================================================
 
-print("\n=== TestResult ===")
+section("TestResult")
 
 result = unittest.TestResult()
 test("result initial testsRun", result.testsRun == 0)
@@ -373,12 +323,4 @@ test("result with failure not successful", not result.wasSuccessful())
 # Summary
 # ============================================================================
 
-print("\n" + "=" * 50)
-print(f"Results: {_passed} passed, {_failed} failed, {_skipped} skipped")
-if _errors:
-    print("Failed tests:")
-    for e in _errors:
-        print(f"  - {e}")
-    sys.exit(1)
-else:
-    print("All tests passed!")
+sys.exit(summary())